@@ -210,6 +210,8 @@ class BassPlayer:
         self.compressor_handle = 0
         self.compressor_enabled = False
         self.temp_file = None
+        # Reused FFT buffer for the visualizer (FFT2048 returns 1024 floats)
+        self._fft_buf = (c_float * 1024)()
         
         # Noise suppression (VST) state
         self.noise_suppression_enabled = False
@@ -638,15 +640,16 @@ class BassPlayer:
         return len_bytes not in (0, 18446744073709551615)
 
 
-    def get_spectrum(self):
-        """Get FFT data for visualization (returns 1024 floats)"""
+    def get_spectrum(self, bins: int = 1024):
+        """Get FFT data for visualization (returns the first `bins` of 1024 floats)"""
         if self.chan == 0:
             return None
         
-        # Buffer for 1024 floats (FFT2048 returns 1024 values)
-        fft_data = (c_float * 1024)()
+        # BASS computes the FFT natively into a buffer reused across frames;
+        # only the bins the caller actually draws are copied out.
+        fft_data = self._fft_buf
         if bass.BASS_ChannelGetData(self.chan, fft_data, BASS_DATA_FFT2048) != -1:
-            return list(fft_data)
+            return fft_data[:bins]
         return None
 
     def set_volume(self, value: int):
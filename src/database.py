@@ -9,6 +9,22 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable
 
 
+# Shared by get_audiobook_info/get_audiobook_files and get_audiobook_with_files
+_AUDIOBOOK_INFO_SQL = '''
+    SELECT id, name, author, title, current_file_index, current_position, duration,
+           COALESCE(playback_speed, 1.0), COALESCE(use_id3_tags, 1),
+           cover_path, cached_cover_path, description
+    FROM audiobooks WHERE path = ? AND is_folder = 0
+'''
+
+_AUDIOBOOK_FILES_SQL = '''
+    SELECT file_path, file_name, duration, track_number, tag_title, start_offset,
+           COALESCE(is_url, 0) as is_url, COALESCE(srt_path, '') as srt_path
+    FROM audiobook_files WHERE audiobook_id = ?
+    ORDER BY track_number, start_offset, file_name
+'''
+
+
 def init_database(db_file: Path, log_func: Callable[[str], None] = print):
     """
     Initialize the database - create tables and indexes.
@@ -380,12 +396,33 @@ class DatabaseManager:
             init_database(self.db_file, log_func=None)
         except Exception as e:
             print(f"Error during DatabaseManager startup migration: {e}")
+        self._enable_wal()
         self.recover_crashed_sessions()
 
+    def _enable_wal(self):
+        """Switch the database to WAL journaling (persistent, stored in the file itself)"""
+        try:
+            conn = sqlite3.connect(self.db_file)
+            try:
+                conn.execute("PRAGMA journal_mode = WAL")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Database error enabling WAL: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for short, frequent transactions such as progress saves"""
+        conn = sqlite3.connect(self.db_file)
+        # With WAL, NORMAL skips the fsync on every commit while staying crash-safe, so
+        # synchronous progress flushes (pause, track or book change) do not stall the UI
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
     def recover_crashed_sessions(self):
         """Find any sessions that were left active (e.g. due to app crash) and close them properly, updating daily stats"""
         import datetime
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         active_sessions = []
         try:
             cursor = conn.cursor()
@@ -417,7 +454,7 @@ class DatabaseManager:
         if not audiobook_id:
             return None
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -438,7 +475,7 @@ class DatabaseManager:
         if not audiobook_id:
             return []
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -470,7 +507,7 @@ class DatabaseManager:
         if not bookmark_id:
             return False
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -491,7 +528,7 @@ class DatabaseManager:
         if not bookmark_id:
             return False
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM bookmarks WHERE id = ?', (bookmark_id,))
@@ -508,7 +545,7 @@ class DatabaseManager:
         if not self.db_file.exists():
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("PRAGMA foreign_keys = OFF")
@@ -533,7 +570,7 @@ class DatabaseManager:
         if not self.db_file.exists():
             return {}
         
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -678,7 +715,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -701,7 +738,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -723,7 +760,7 @@ class DatabaseManager:
 
     def mark_audiobook_completed(self, audiobook_id: int, total_duration: float):
         """Mark an audiobook as completely listened"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -750,7 +787,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -804,7 +841,7 @@ class DatabaseManager:
         """Find audiobook by content hash"""
         if not content_hash:
             return None
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -823,15 +860,10 @@ class DatabaseManager:
 
     def get_audiobook_info(self, audiobook_path: str) -> Optional[Tuple]:
         """Get information about a specific audiobook by path"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
-            cursor.execute('''
-            SELECT id, name, author, title, current_file_index, current_position, duration, 
-                   COALESCE(playback_speed, 1.0), COALESCE(use_id3_tags, 1),
-                   cover_path, cached_cover_path, description
-            FROM audiobooks WHERE path = ? AND is_folder = 0
-        ''', (audiobook_path,))
+            cursor.execute(_AUDIOBOOK_INFO_SQL, (audiobook_path,))
             return cursor.fetchone()
         except sqlite3.Error as e:
             print(f"Database error in get_audiobook_info: {e}")
@@ -841,15 +873,10 @@ class DatabaseManager:
     
     def get_audiobook_files(self, audiobook_id: int) -> List[Tuple]:
         """Get list of files for a specific audiobook by ID"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT file_path, file_name, duration, track_number, tag_title, start_offset,
-                       COALESCE(is_url, 0) as is_url, COALESCE(srt_path, '') as srt_path
-                FROM audiobook_files WHERE audiobook_id = ?
-                ORDER BY track_number, start_offset, file_name
-            ''', (audiobook_id,))
+            cursor.execute(_AUDIOBOOK_FILES_SQL, (audiobook_id,))
             return cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Database error in get_audiobook_files: {e}")
@@ -857,6 +884,28 @@ class DatabaseManager:
         finally:
             conn.close()
     
+    def get_audiobook_with_files(self, audiobook_path: str) -> Tuple[Optional[Tuple], List[Tuple]]:
+        """Get get_audiobook_info() and get_audiobook_files() results over one connection.
+
+        Both SELECTs run in a single read transaction, so the header and the
+        file rows come from the same snapshot.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute(_AUDIOBOOK_INFO_SQL, (audiobook_path,))
+            info = cursor.fetchone()
+            if not info:
+                return None, []
+            cursor.execute(_AUDIOBOOK_FILES_SQL, (info[0],))
+            return info, cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error in get_audiobook_with_files: {e}")
+            return None, []
+        finally:
+            conn.close()
+    
     def save_progress(self, audiobook_id: int, file_index: int, position: float,
                       speed: float, listened_duration: float, progress_percent: int,
                       update_timestamp: bool = True):
@@ -864,7 +913,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
         
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -913,7 +962,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("PRAGMA foreign_keys = ON")
@@ -930,7 +979,7 @@ class DatabaseManager:
         if not folder_path:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("PRAGMA foreign_keys = ON")
@@ -952,7 +1001,7 @@ class DatabaseManager:
         if not folder_path:
             return []
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             pattern = folder_path + os.sep + '%'
@@ -973,7 +1022,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -992,7 +1041,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1011,7 +1060,7 @@ class DatabaseManager:
         if not self.db_file.exists():
             return 0
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM audiobooks WHERE is_folder = 0')
@@ -1024,7 +1073,7 @@ class DatabaseManager:
     
     def get_audiobook_by_path(self, path: str) -> Optional[Dict]:
         """Get audiobook data by its path for tree updates"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1078,7 +1127,7 @@ class DatabaseManager:
 
     def update_folder_expanded_state(self, path: str, is_expanded: bool):
         """Update the is_expanded state for a folder"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1094,7 +1143,7 @@ class DatabaseManager:
 
     def set_folder_merged(self, path: str, is_merged: bool):
         """Update the is_merged state for a folder"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1115,7 +1164,7 @@ class DatabaseManager:
         if not audiobook_id:
             return False
 
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -1138,7 +1187,7 @@ class DatabaseManager:
 
     def create_tag(self, name: str, color: str = None) -> Optional[int]:
         """Create a new tag. Returns the tag ID or None if failed (e.g. duplicate)."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("INSERT INTO tags (name, color) VALUES (?, ?)", (name, color))
@@ -1155,7 +1204,7 @@ class DatabaseManager:
 
     def delete_tag(self, tag_id: int):
         """Delete a tag."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("PRAGMA foreign_keys = ON")
@@ -1168,7 +1217,7 @@ class DatabaseManager:
             
     def update_tag(self, tag_id: int, name: str, color: str):
         """Update a tag's name and color."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("UPDATE tags SET name = ?, color = ? WHERE id = ?", (name, color, tag_id))
@@ -1180,7 +1229,7 @@ class DatabaseManager:
 
     def add_tag_to_audiobook(self, audiobook_id: int, tag_id: int):
         """Assign a tag to an audiobook."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("INSERT OR IGNORE INTO audiobook_tags (audiobook_id, tag_id) VALUES (?, ?)", 
@@ -1193,7 +1242,7 @@ class DatabaseManager:
 
     def remove_tag_from_audiobook(self, audiobook_id: int, tag_id: int):
         """Remove a tag from an audiobook."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM audiobook_tags WHERE audiobook_id = ? AND tag_id = ?", 
@@ -1206,7 +1255,7 @@ class DatabaseManager:
 
     def remove_all_tags_from_audiobook(self, audiobook_id: int):
         """Remove all tags from an audiobook."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM audiobook_tags WHERE audiobook_id = ?", 
@@ -1219,7 +1268,7 @@ class DatabaseManager:
 
     def get_all_tags(self) -> List[Dict]:
         """Get all defined tags."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT id, name, color FROM tags ORDER BY name")
@@ -1232,7 +1281,7 @@ class DatabaseManager:
 
     def get_tags_for_audiobook(self, audiobook_id: int) -> List[Dict]:
         """Get tags assigned to a specific audiobook."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             query = """
@@ -1255,7 +1304,7 @@ class DatabaseManager:
         Get a mapping of audiobook_id -> list of tags. 
         Used for efficient bulk loading in the library view.
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             query = """
@@ -1283,7 +1332,7 @@ class DatabaseManager:
         if not audiobook_id:
             return None
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1320,7 +1369,7 @@ class DatabaseManager:
         if not audiobook_id:
             return
 
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1339,7 +1388,7 @@ class DatabaseManager:
         if not audiobook_ids or not fields:
             return
 
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             set_parts = []
@@ -1362,7 +1411,7 @@ class DatabaseManager:
         """Get all cover options for an audiobook"""
         if not audiobook_id:
             return []
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute('''
@@ -1391,7 +1440,7 @@ class DatabaseManager:
         """Set which cover is selected for the audiobook and update the main table"""
         if not audiobook_id:
             return
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             if cover_id is not None:
@@ -1459,7 +1508,7 @@ class DatabaseManager:
         if not self.db_file.exists():
             return []
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             # Union of both columns, distinct, non-empty
@@ -1486,7 +1535,7 @@ class DatabaseManager:
         if not audiobook_id:
             return []
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         values = set()
         try:
             cursor = conn.cursor()
@@ -1531,7 +1580,7 @@ class DatabaseManager:
         if not audiobook_id:
             return None
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -1564,7 +1613,7 @@ class DatabaseManager:
         if not audiobook_id:
             return []
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         # Enable row factory to access columns by name
         conn.row_factory = sqlite3.Row 
         try:
@@ -1593,12 +1642,34 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def get_bookmark(self, bookmark_id: int) -> Optional[Dict]:
+        """Get a single bookmark by its ID"""
+        if not bookmark_id:
+            return None
+            
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, audiobook_id, file_name, time_position, title, description, created_at
+                FROM bookmarks
+                WHERE id = ?
+            """, (bookmark_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+        except sqlite3.Error as e:
+            print(f"Database error in get_bookmark: {e}")
+            return None
+        finally:
+            conn.close()
+
     def add_bookmark(self, audiobook_id: int, file_name: str, time_position: float, title: str, description: str) -> Optional[int]:
         """Add a new bookmark"""
         if not audiobook_id:
             return None
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -1618,7 +1689,7 @@ class DatabaseManager:
         if not bookmark_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -1637,7 +1708,7 @@ class DatabaseManager:
         if not bookmark_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,))
@@ -1667,7 +1738,7 @@ class DatabaseManager:
             except (ValueError, AttributeError):
                 pass
         
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -1725,7 +1796,7 @@ class DatabaseManager:
 
     def update_file_duration(self, audiobook_id: int, file_path: str, duration: float):
         """Update duration of a specific file in audiobook_files and recalculate book duration."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -1768,7 +1839,7 @@ class DatabaseManager:
         if not audiobook_id:
             return None
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             session_date = start_time.strftime('%Y-%m-%d')
@@ -1800,7 +1871,7 @@ class DatabaseManager:
         if not session_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -1825,7 +1896,7 @@ class DatabaseManager:
         if not session_id:
             return
             
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -1879,7 +1950,7 @@ class DatabaseManager:
         Returns:
             List of dictionaries with daily statistics
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -1944,7 +2015,7 @@ class DatabaseManager:
         Returns:
             List of dictionaries with monthly statistics
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -2004,7 +2075,7 @@ class DatabaseManager:
         Returns:
             List of dictionaries with yearly statistics
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -2062,7 +2133,7 @@ class DatabaseManager:
         """
         from datetime import datetime, timedelta
         
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -2117,7 +2188,7 @@ class DatabaseManager:
                 ...
             }
         """
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             
@@ -2172,7 +2243,7 @@ class DatabaseManager:
         """Retrieves a cached translation from the database."""
         import json
         cleaned = text.strip()
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             conn.row_factory = sqlite3.Row
             c = conn.cursor()
@@ -2200,7 +2271,7 @@ class DatabaseManager:
         translation = result_dict.get("translation", "")
         parts_of_speech_json = json.dumps(result_dict.get("parts_of_speech", {}))
         synonyms_json = json.dumps(result_dict.get("synonyms", {}))
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             c = conn.cursor()
             c.execute(
@@ -2227,7 +2298,7 @@ class DatabaseManager:
         cleaned_trans = translation.strip()
         if not cleaned_word:
             return False
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             c = conn.cursor()
             c.execute(
@@ -2247,7 +2318,7 @@ class DatabaseManager:
         cleaned_word = word.strip()
         if not cleaned_word:
             return False
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             c = conn.cursor()
             c.execute(
@@ -2266,7 +2337,7 @@ class DatabaseManager:
         cleaned_word = word.strip()
         if not cleaned_word:
             return False
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         try:
             c = conn.cursor()
             c.execute(
@@ -201,6 +201,7 @@ class AudiobookPlayerWindow(QMainWindow):
         self.playback_controller.on_load_start = self.on_stream_load_start
         self.playback_controller.on_load_error = self.on_stream_load_error
         self.playback_controller.on_status_update = self._on_playback_status
+        self.playback_controller.on_progress_saved = self.refresh_audiobook_in_tree
         self.status_requested.connect(self.statusBar().showMessage)
 
         self.taskbar_progress = TaskbarProgress()
@@ -2023,6 +2024,7 @@ class AudiobookPlayerWindow(QMainWindow):
         if self.playback_controller.current_audiobook_path:
             if save_progress:
                 self.playback_controller.save_current_progress()
+                self.playback_controller.flush_progress()
                 self.save_last_session()
 
             # Stop active playback and unload file to release locks
@@ -2043,16 +2045,7 @@ class AudiobookPlayerWindow(QMainWindow):
             self.update_ui_for_audiobook()
 
             # Reset player UI components specifically
-            self.player_widget.position_slider.setValue(0)
-            self.player_widget.total_progress_bar.setValue(0)
-            self.player_widget.time_current.setText("0:00")
-            self.player_widget.time_duration.setText("0:00")
-            self.player_widget.total_time_label.setText("0:00:00")
-            self.player_widget.total_duration_label.setText("0:00:00")
-            self.player_widget.total_percent_label.setText(
-                trf("formats.percent", value=0)
-            )
-            self.player_widget.time_left_label.setText(tr("player.time_left_unknown"))
+            self.player_widget.reset_progress_display()
 
             if self.delegate:
                 self.delegate.playing_path = None  # Remove tree highlighting
@@ -2115,6 +2108,7 @@ class AudiobookPlayerWindow(QMainWindow):
             self.thumbnail_buttons.update_play_state(self.player.is_playing())
 
         self.playback_controller.save_current_progress()
+        self.playback_controller.flush_progress()
         self.save_last_session()
 
     def on_next_clicked(self):
@@ -2230,9 +2224,13 @@ class AudiobookPlayerWindow(QMainWindow):
 
     def refresh_audiobook_in_tree(self):
         """Trigger a metadata refresh for the active audiobook's visual representation in the library tree"""
-        self.library_widget.refresh_audiobook_item(
-            self.playback_controller.current_audiobook_path
-        )
+        audiobook_path = self.playback_controller.current_audiobook_path
+        self.library_widget.refresh_audiobook_item(audiobook_path)
+        # The refresh reads the DB; progress still coalesced in memory is shown from the
+        # snapshot, and the item is refreshed again once its background write lands
+        unsaved = self.playback_controller.get_unsaved_progress()
+        if unsaved is not None:
+            self.library_widget.update_item_progress(audiobook_path, *unsaved)
 
     def reveal_current_audiobook(self):
         """Scroll to the currently playing audiobook in the library tree"""
@@ -2284,7 +2282,7 @@ class AudiobookPlayerWindow(QMainWindow):
             self.player_widget.subtitle_panel.update_position(pos - start_offset)
 
         # Synchronize aggregate audiobook progress indicators
-        total_pos = self.playback_controller.get_current_position()
+        total_pos = self.playback_controller.get_current_position(pos)
         self.player_widget.update_total_progress(
             total_pos,
             self.playback_controller.total_duration,
@@ -2298,27 +2296,29 @@ class AudiobookPlayerWindow(QMainWindow):
         self._library_update_counter += 1
         if self._library_update_counter >= 10:  # 100ms * 10 = 1000ms
             self._library_update_counter = 0
+            # Persist progress coalesced from recent seeks/skips once it is due
+            self.playback_controller.flush_progress(only_if_due=True)
             if self.playback_controller.current_audiobook_path:
-                progress_percent = self.playback_controller.get_progress_percent()
+                progress_percent = self.playback_controller.get_progress_percent(total_pos)
                 self.library_widget.update_item_progress(
                     self.playback_controller.current_audiobook_path,
                     total_pos,
                     progress_percent,
                 )
 
-        # Synchronize play/pause button aesthetics
-        self.player_widget.set_playing(self.player.is_playing())
+        # Synchronize play/pause button aesthetics (one BASS state query per tick)
+        is_playing = self.player.is_playing()
+        self.player_widget.set_playing(is_playing)
 
         # Update listening statistics tracker
         if hasattr(self, 'listening_tracker'):
-            is_playing = self.player.is_playing()
             current_speed = self.player.speed_pos / 10.0
             self.listening_tracker.update_session(is_playing, current_speed)
 
         # Synchronize Windows taskbar progress metrics
         if self.playback_controller.total_duration > 0:
             self.taskbar_progress.update_for_playback(
-                is_playing=self.player.is_playing(),
+                is_playing=is_playing,
                 current=total_pos,
                 total=self.playback_controller.total_duration,
             )
@@ -2911,16 +2911,7 @@ class AudiobookPlayerWindow(QMainWindow):
             self.update_ui_for_audiobook()  # Resets labels and playlist
 
             # Reset player UI components specifically
-            self.player_widget.position_slider.setValue(0)
-            self.player_widget.total_progress_bar.setValue(0)
-            self.player_widget.time_current.setText("0:00")
-            self.player_widget.time_duration.setText("0:00")
-            self.player_widget.total_time_label.setText("0:00:00")
-            self.player_widget.total_duration_label.setText("0:00:00")
-            self.player_widget.total_percent_label.setText(
-                trf("formats.percent", value=0)
-            )
-            self.player_widget.time_left_label.setText(tr("player.time_left_unknown"))
+            self.player_widget.reset_progress_display()
 
             if self.delegate:
                 self.delegate.playing_path = None  # Remove tree highlighting
@@ -3128,6 +3119,7 @@ class AudiobookPlayerWindow(QMainWindow):
             self.player.rewind(-30)
 
         self.playback_controller.save_current_progress()
+        self.playback_controller.flush_progress()
         self.save_last_session()
         
         # Close active listening session
@@ -8,6 +8,7 @@ import subprocess
 import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
@@ -15,10 +16,42 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 from PyQt6.QtCore import QThread, pyqtSignal
 
+# Optional in-process probing via PyAV (libavformat bindings)
+PYAV_AVAILABLE = False
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    pass
 
-SUPPORTED_INPUT_FORMATS = {
-    '.mp3', '.m4a', '.m4b', '.aac', '.flac', '.wav', '.ogg', '.wma', '.ape'
-}
+
+# Lower-case extensions without the leading dot, matched against the tail of
+# the file name so rejected entries never need a Path object
+SUPPORTED_INPUT_FORMATS = frozenset({
+    'mp3', 'm4a', 'm4b', 'aac', 'flac', 'wav', 'ogg', 'wma', 'ape'
+})
+
+
+def _iter_convertible_files(root: str):
+    """Yield paths (str) of convertible audio files under root, using os.scandir"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        # Empty stem means no real suffix ('mp3', '.mp3'), as with Path.suffix
+                        stem, _, ext = entry.name.rpartition('.')
+                        if stem and ext.lower() in SUPPORTED_INPUT_FORMATS and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 @dataclass
@@ -46,6 +79,7 @@ class OpusConversionThread(QThread):
     
     # Signals
     progress = pyqtSignal(int, int, str)          # current, total, filename
+    overall_progress = pyqtSignal(float)           # fraction of the job done, incl. files in flight (0..1)
     file_converted = pyqtSignal(str, str, str)     # old_path, new_path, bitrate
     log_message = pyqtSignal(str)                  # log text
     conversion_finished = pyqtSignal(bool, str)    # success, summary message
@@ -72,11 +106,22 @@ class OpusConversionThread(QThread):
         self.max_workers = max_workers if max_workers > 0 else min(os.cpu_count() or 4, 8)
         self._cancelled = False
         self._lock = Lock()
+        self._active_procs = set()
+        self._completed = 0
+        self._partial = {}  # input path -> fraction encoded, for files in flight
         self.stats = ConversionStats()
     
     def cancel(self):
         """Request cancellation of the conversion process"""
         self._cancelled = True
+        # Kill running encoders so workers blocked on their progress pipe wake immediately
+        with self._lock:
+            procs = list(self._active_procs)
+        for proc in procs:
+            try:
+                proc.kill()
+            except Exception:
+                pass
     
     def run(self):
         """Main conversion process with parallel workers"""
@@ -115,6 +160,9 @@ class OpusConversionThread(QThread):
                     
                     file_path = future_to_file[future]
                     completed += 1
+                    with self._lock:
+                        self._completed = completed
+                        self._partial.pop(file_path, None)
                     
                     try:
                         result = future.result()
@@ -149,17 +197,32 @@ class OpusConversionThread(QThread):
             self.log_message.emit(f"Critical error: {e}")
             self.conversion_finished.emit(False, str(e))
     
+    def _report_partial(self, input_file: Path, fraction: float):
+        """Record a worker's in-file progress and emit the overall fraction"""
+        with self._lock:
+            self._partial[input_file] = fraction
+            done = self._completed + sum(self._partial.values())
+        total = self.stats.total_files
+        if total > 0:
+            self.overall_progress.emit(min(done / total, 1.0))
+    
     def _check_ffmpeg(self) -> bool:
-        """Check if ffmpeg is available and supports opus"""
+        """Check if ffmpeg is available and supports opus.
+
+        Queries only the libopus encoder help instead of the full '-codecs'
+        listing; the call also maps ffmpeg's image and DLLs into the OS page
+        cache so the first pool workers don't all start cold.
+        """
         try:
             result = subprocess.run(
-                [self.ffmpeg_path, "-codecs"],
+                [self.ffmpeg_path, "-hide_banner", "-h", "encoder=libopus"],
                 capture_output=True, text=True, timeout=10,
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
-            if "libopus" not in result.stdout:
+            if "Encoder libopus" not in result.stdout:
                 self.log_message.emit("FFmpeg does not have Opus codec support (libopus)")
                 return False
+            self._prewarm_ffprobe()
             return True
         except FileNotFoundError:
             self.log_message.emit(f"FFmpeg not found at: {self.ffmpeg_path}")
@@ -168,46 +231,47 @@ class OpusConversionThread(QThread):
             self.log_message.emit(f"Error checking FFmpeg: {e}")
             return False
     
+    def _prewarm_ffprobe(self):
+        """Load ffprobe once before the worker pool starts (skipped with PyAV)"""
+        if PYAV_AVAILABLE:
+            return
+        try:
+            subprocess.run(
+                [self.ffprobe_path, "-hide_banner", "-version"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            )
+        except Exception:
+            pass
+    
     def _find_convertible_files(self) -> List[Path]:
         """Find all audio files that can be converted to opus"""
         files = []
         for path in self.library_paths:
             if not path.exists():
                 continue
-            for f in sorted(path.rglob("*")):
-                if f.is_file() and f.suffix.lower() in SUPPORTED_INPUT_FORMATS:
-                    files.append(f)
+            files.extend(sorted(Path(p) for p in _iter_convertible_files(str(path))))
         return files
     
-    def _get_audio_duration(self, file_path: Path) -> Optional[float]:
-        """Get audio file duration using ffprobe"""
-        try:
-            cmd = [
-                self.ffprobe_path,
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "json",
-                str(file_path)
-            ]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                return float(data.get("format", {}).get("duration", 0))
-        except Exception:
-            pass
-        return None
-    
-    def _get_audio_channels(self, file_path: Path) -> int:
-        """Get number of audio channels"""
+    def _probe_audio(self, file_path: Path) -> dict:
+        """Probe duration, channels and bitrate with a single ffprobe call.
+
+        Returns a dict with 'duration' (float or None), 'channels' (int)
+        and 'bitrate' (kbps, 0 if unknown). Uses PyAV in-process when it
+        is installed, falling back to ffprobe.
+        """
+        if PYAV_AVAILABLE:
+            info = self._probe_audio_pyav(file_path)
+            if info is not None:
+                return info
+        
+        info = {"duration": None, "channels": 2, "bitrate": 0}
         try:
             cmd = [
                 self.ffprobe_path,
                 "-v", "error",
                 "-select_streams", "a:0",
-                "-show_entries", "stream=channels",
+                "-show_entries", "format=duration,bit_rate:stream=channels,bit_rate",
                 "-of", "json",
                 str(file_path)
             ]
@@ -217,56 +281,45 @@ class OpusConversionThread(QThread):
             )
             if result.returncode == 0:
                 data = json.loads(result.stdout)
+                fmt = data.get("format", {})
                 streams = data.get("streams", [])
-                if streams:
-                    return int(streams[0].get("channels", 2))
+                stream = streams[0] if streams else {}
+                
+                if fmt.get("duration"):
+                    info["duration"] = float(fmt["duration"])
+                if stream.get("channels"):
+                    info["channels"] = int(stream["channels"])
+                # Prefer stream-level bitrate, fall back to format-level
+                bit_rate = stream.get("bit_rate") or fmt.get("bit_rate")
+                if bit_rate:
+                    info["bitrate"] = int(bit_rate) // 1000  # bps -> kbps
         except Exception:
             pass
-        return 2
+        return info
     
-    def _get_audio_bitrate(self, file_path: Path) -> int:
-        """Get actual audio bitrate in kbps using ffprobe"""
+    def _probe_audio_pyav(self, file_path: Path) -> Optional[dict]:
+        """Probe audio info in-process with PyAV. Returns None on failure."""
         try:
-            cmd = [
-                self.ffprobe_path,
-                "-v", "error",
-                "-select_streams", "a:0",
-                "-show_entries", "stream=bit_rate",
-                "-of", "json",
-                str(file_path)
-            ]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                streams = data.get("streams", [])
-                if streams:
-                    bit_rate = streams[0].get("bit_rate")
-                    if bit_rate:
-                        return int(bit_rate) // 1000  # bps -> kbps
-            # Fallback: try format-level bitrate
-            cmd2 = [
-                self.ffprobe_path,
-                "-v", "error",
-                "-show_entries", "format=bit_rate",
-                "-of", "json",
-                str(file_path)
-            ]
-            result2 = subprocess.run(
-                cmd2, capture_output=True, text=True, timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            if result2.returncode == 0:
-                data2 = json.loads(result2.stdout)
-                fmt = data2.get("format", {})
-                bit_rate = fmt.get("bit_rate")
+            with av.open(str(file_path)) as container:
+                if not container.streams.audio:
+                    return None
+                stream = container.streams.audio[0]
+                info = {"duration": None, "channels": 2, "bitrate": 0}
+                
+                if container.duration:
+                    info["duration"] = container.duration / av.time_base
+                elif stream.duration and stream.time_base:
+                    info["duration"] = float(stream.duration * stream.time_base)
+                
+                ctx = stream.codec_context
+                if ctx.channels:
+                    info["channels"] = int(ctx.channels)
+                bit_rate = ctx.bit_rate or container.bit_rate
                 if bit_rate:
-                    return int(bit_rate) // 1000
+                    info["bitrate"] = int(bit_rate) // 1000  # bps -> kbps
+                return info
         except Exception:
-            pass
-        return 0
+            return None
     
     def _convert_file(self, input_file: Path) -> ConversionResult:
         """Convert a single audio file to opus, replacing the original"""
@@ -288,12 +341,12 @@ class OpusConversionThread(QThread):
             return ConversionResult(False, old_path, new_path, "Cancelled")
         
         try:
-            # Get original duration for verification
-            original_duration = self._get_audio_duration(input_file)
+            # Get original duration (for verification) and channel layout in one probe
+            source_info = self._probe_audio(input_file)
+            original_duration = source_info["duration"]
             
             # Determine stereo handling
-            channels = self._get_audio_channels(input_file)
-            is_stereo = channels > 1
+            is_stereo = source_info["channels"] > 1
             
             target_bitrate = self.bitrate
             audio_filter = None
@@ -306,6 +359,8 @@ class OpusConversionThread(QThread):
                 self.ffmpeg_path,
                 "-y",
                 "-v", "error",
+                "-nostats",
+                "-progress", "pipe:1",   # k=v progress reports on stdout
                 "-i", str(input_file),
                 "-map", "0:a",           # Audio streams only
                 "-map_metadata", "0",    # Copy all metadata
@@ -324,21 +379,42 @@ class OpusConversionThread(QThread):
                 str(output_file)
             ])
             
-            # Run conversion with Popen for cancellation support
+            # Run conversion with Popen for cancellation support.
+            # stderr goes to a temp file rather than an undrained pipe, so a
+            # chatty encode can never block on a full pipe buffer.
             creation_flags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=creation_flags
-            )
-            
-            # Poll with cancellation check
-            import time
-            while proc.poll() is None:
+            with tempfile.TemporaryFile() as stderr_file:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    creationflags=creation_flags
+                )
+                with self._lock:
+                    self._active_procs.add(proc)
+                
+                # Block on the progress pipe instead of sleeping: the worker wakes
+                # only when ffmpeg reports, and cancel() kills the process to end it
+                try:
+                    if self._cancelled:
+                        proc.kill()
+                    for line in proc.stdout:
+                        if self._cancelled:
+                            proc.kill()
+                            break
+                        if original_duration and line.startswith(b"out_time_us="):
+                            try:
+                                out_seconds = int(line[12:]) / 1_000_000
+                            except ValueError:
+                                continue  # "N/A" before the first packet
+                            self._report_partial(input_file, min(out_seconds / original_duration, 1.0))
+                    proc.wait()
+                finally:
+                    proc.stdout.close()
+                    with self._lock:
+                        self._active_procs.discard(proc)
+                
                 if self._cancelled:
-                    proc.kill()
-                    proc.wait(timeout=5)
                     # Clean up partial output
                     if output_file.exists():
                         try:
@@ -346,23 +422,27 @@ class OpusConversionThread(QThread):
                         except Exception:
                             pass
                     return ConversionResult(False, old_path, new_path, "Cancelled")
-                time.sleep(0.3)
-            
-            if proc.returncode != 0:
-                # Clean up failed output
-                if output_file.exists():
-                    output_file.unlink()
-                stderr = proc.stderr.read().decode('utf-8', errors='replace') if proc.stderr else ""
-                error_msg = stderr.strip()[:200] if stderr else "Unknown error"
-                return ConversionResult(False, old_path, new_path, f"FFmpeg error: {error_msg}")
+                
+                if proc.returncode != 0:
+                    # Clean up failed output
+                    if output_file.exists():
+                        output_file.unlink()
+                    # Only the head of stderr is reported, so don't decode the rest
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read(1024).decode('utf-8', errors='replace')
+                    error_msg = stderr.strip()[:200] if stderr.strip() else "Unknown error"
+                    return ConversionResult(False, old_path, new_path, f"FFmpeg error: {error_msg}")
             
             # Verify output exists
             if not output_file.exists():
                 return ConversionResult(False, old_path, new_path, "Output file was not created")
             
+            # Probe the output once for both duration verification and actual bitrate
+            output_info = self._probe_audio(output_file)
+            
             # Verify duration matches (within 2 seconds tolerance)
             if original_duration and original_duration > 0:
-                new_duration = self._get_audio_duration(output_file)
+                new_duration = output_info["duration"]
                 if new_duration and abs(original_duration - new_duration) > 2.0:
                     output_file.unlink()
                     return ConversionResult(
@@ -370,8 +450,7 @@ class OpusConversionThread(QThread):
                         f"Duration mismatch: {original_duration:.1f}s vs {new_duration:.1f}s"
                     )
             
-            # Probe actual bitrate from the output file
-            actual_bitrate = self._get_audio_bitrate(output_file)
+            actual_bitrate = output_info["bitrate"]
             
             # Delete original file
             try:
@@ -398,11 +477,6 @@ class OpusConversionThread(QThread):
 
 def count_convertible_files(library_path: str) -> int:
     """Count the number of non-opus audio files in the library"""
-    count = 0
-    lib = Path(library_path)
-    if not lib.exists():
+    if not os.path.exists(library_path):
         return 0
-    for f in lib.rglob("*"):
-        if f.is_file() and f.suffix.lower() in SUPPORTED_INPUT_FORMATS:
-            count += 1
-    return count
+    return sum(1 for _ in _iter_convertible_files(library_path))
@@ -210,6 +210,7 @@ class OpusConversionDialog(QDialog):
         )
         
         self.thread.progress.connect(self._on_progress)
+        self.thread.overall_progress.connect(self._on_overall_progress)
         self.thread.file_converted.connect(self._on_file_converted)
         self.thread.log_message.connect(self._on_log)
         self.thread.conversion_finished.connect(self._on_finished)
@@ -225,11 +226,20 @@ class OpusConversionDialog(QDialog):
     def _on_progress(self, current: int, total: int, filename: str):
         """Update progress bar and label"""
         percent = int(current * 100 / total) if total > 0 else 0
-        self.progress_bar.setValue(percent)
+        self._advance_progress_bar(percent)
         self.progress_label.setText(
             trf("opus_converter.progress", current=current, total=total)
         )
     
+    def _on_overall_progress(self, fraction: float):
+        """Advance the progress bar while files are still encoding"""
+        self._advance_progress_bar(int(fraction * 100))
+    
+    def _advance_progress_bar(self, percent: int):
+        """Only move the bar forward: finished-file counts lag behind the in-flight fraction"""
+        if percent > self.progress_bar.value():
+            self.progress_bar.setValue(percent)
+    
     def _on_file_converted(self, old_path: str, new_path: str, bitrate: str):
         """Forward file conversion signal"""
         self.file_converted.emit(old_path, new_path, bitrate)
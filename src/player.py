@@ -1,14 +1,15 @@
 import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, 
     QLabel, QProgressBar, QListWidget, QListWidgetItem, QSizePolicy,
     QFrame, QGridLayout, QStyle, QStyleOptionSlider, QStyleOptionProgressBar,
     QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, pyqtProperty
-from PyQt6.QtGui import QPainter, QPen, QColor, QPaintEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QTimer, QThread, QEvent, QSignalBlocker, pyqtProperty
+from PyQt6.QtGui import QPainter, QPen, QColor, QPaintEvent, QFont
 
 from bass_player import BassPlayer
 from database import DatabaseManager
@@ -19,8 +20,58 @@ from utils import get_icon, format_time, format_time_short
 from visualizer import VisualizerButton
 
 
+# file_list item data roles
+_PATH_ROLE = Qt.ItemDataRole.UserRole                # file path of the row
+_ORIGINAL_TEXT_ROLE = Qt.ItemDataRole.UserRole + 1   # row label without the playing marker
+
+
+def _set_text_if_changed(label: QLabel, text: str):
+    """Set label text only when it differs, avoiding a relayout/repaint per UI tick"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_value_if_changed(widget, value: int):
+    """Set slider/progress bar value only when it differs"""
+    if widget.value() != value:
+        widget.setValue(value)
+
+
+class ProgressSaveThread(QThread):
+    """Writes one progress snapshot to the database so periodic saves do not block the UI."""
+
+    def __init__(self, db: DatabaseManager, pending: tuple, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.pending = pending
+
+    def run(self):
+        *args, update_timestamp = self.pending
+        try:
+            self.db.save_progress(*args, update_timestamp=update_timestamp)
+        except Exception as e:
+            print(f"Error saving progress in background: {e}")
+
+
 class PlaybackController:
     """Manages playback logic, including file switching, progress tracking, and session persistence"""
+    # Fixed attribute set: no per-instance __dict__ for an object read on every UI tick.
+    # __weakref__ is needed for Qt signal connections to bound methods.
+    __slots__ = (
+        'player', 'db', 'library_root', 'listening_tracker',
+        'current_audiobook_id', 'current_audiobook_path', 'current_file_index',
+        'files_list', 'global_position', '_total_duration', '_percent_scale',
+        '_completion_threshold', 'use_id3_tags', 'current_cover_path', 'current_description',
+        '_cached_name', '_cached_author', '_cached_title',
+        '_cum_offsets', '_cum_offsets_source', '_name_to_index', '_name_to_index_source',
+        '_abs_paths_root', '_abs_paths_source',
+        'saved_file_index', 'saved_position',
+        '_pending_progress', '_last_flush_time', 'progress_flush_interval', '_save_thread',
+        'on_progress_saved',
+        '_stream_end_pending', 'on_load_start', 'on_load_error', 'on_load_complete',
+        'on_status_update', '_url_loading', '_url_load_context', '_target_seek_position',
+        'max_connect_attempts', '__weakref__',
+    )
     def __init__(self, player: BassPlayer, db_manager: DatabaseManager):
         """Initialize the controller with audio player and database manager"""
         self.player = player
@@ -34,13 +85,37 @@ class PlaybackController:
         self.current_file_index: int = 0
         self.files_list: List[Dict] = []
         self.global_position: float = 0.0
+        # Prefix sums of file durations: _cum_offsets[i] is the start of file i,
+        # _cum_offsets[-1] the total. Rebuilt whenever files_list or a duration changes.
+        self._cum_offsets: List[float] = [0.0]
+        self._cum_offsets_source: Optional[List[Dict]] = None
+        # file_name -> first index in files_list, for bookmark lookups
+        self._name_to_index: Dict[str, int] = {}
+        self._name_to_index_source: Optional[List[Dict]] = None
+        # files_list entries carry an 'abs' key resolved against this root
+        self._abs_paths_root: Optional[Path] = None
+        self._abs_paths_source: Optional[List[Dict]] = None
         self.total_duration: float = 0.0
         self.use_id3_tags: bool = True
         self.current_description: str = ""
         
+        # Metadata of the loaded audiobook, cached at load time
+        self._cached_name: str = ""
+        self._cached_author: str = ""
+        self._cached_title: str = ""
+        
         # Saved state for session restoration
         self.saved_file_index: Optional[int] = None
         self.saved_position: Optional[float] = None
+        
+        # Write-back cache for save_current_progress: rapid seeks/skips are
+        # coalesced into at most one DB write per progress_flush_interval
+        self._pending_progress: Optional[tuple] = None
+        self._last_flush_time: float = float("-inf")
+        self.progress_flush_interval: float = 5.0
+        # At most one background write in flight; newer progress waits in _pending_progress
+        self._save_thread: Optional[ProgressSaveThread] = None
+        self.on_progress_saved: Optional[Callable[[], None]] = None  # after a background write lands
 
         # Stream end callback flag
         self._stream_end_pending = False
@@ -54,6 +129,17 @@ class PlaybackController:
         self._target_seek_position: Optional[float] = None
         self.max_connect_attempts = 5
 
+    @property
+    def total_duration(self) -> float:
+        return self._total_duration
+    
+    @total_duration.setter
+    def total_duration(self, value: float):
+        # Derived constants for get_progress_percent, refreshed on every change
+        self._total_duration = value
+        self._percent_scale = 100.0 / value if value > 0 else 0.0
+        self._completion_threshold = value - 1
+
     def _emit_status(self, msg: str):
         """Helper to safely trigger the on_status_update callback if defined"""
         if callable(self.on_status_update):
@@ -80,13 +166,14 @@ class PlaybackController:
         # Guard: Only save if we are switching to a DIFFERENT book!
         if self.current_audiobook_path and self.current_audiobook_path != audiobook_path:
             self.save_current_progress(update_timestamp=False)
+        self.flush_progress()
         
         # End current listening session before switching books
         if self.listening_tracker and self.current_audiobook_id:
             self.listening_tracker.end_session()
         
-        # Retrieve audiobook metadata
-        audiobook_info = self.db.get_audiobook_info(audiobook_path)
+        # Retrieve audiobook metadata and its file list in one round-trip
+        audiobook_info, files = self.db.get_audiobook_with_files(audiobook_path)
         if not audiobook_info:
             return False
         
@@ -103,16 +190,17 @@ class PlaybackController:
         self.saved_position = saved_position
         self.use_id3_tags = bool(use_id3_tags)
         self.current_description = description or ""
+        self._cached_name = abook_name or ""
+        self._cached_author = author or ""
+        self._cached_title = title or ""
         
         # Prioritize cached cover path
         self.current_cover_path = cached_cover_path if cached_cover_path else cover_path
         
-        # Load audiobook file list
-        files = self.db.get_audiobook_files(audiobook_id)
-        self.files_list = []
-        
-        for file_path, file_name, duration, track_num, tag_title, start_offset, is_url, srt_path in files:
-            self.files_list.append({
+        # Build the audiobook file list in one pass. A fresh list is bound on
+        # every load: the offset/path caches detect a new book by identity.
+        self.files_list = [
+            {
                 'path': file_path,
                 'name': file_name,
                 'tag_title': tag_title or '',
@@ -120,7 +208,11 @@ class PlaybackController:
                 'start_offset': start_offset or 0,
                 'is_url': bool(is_url),
                 'srt_path': srt_path or ''
-            })
+            }
+            for file_path, file_name, duration, track_num, tag_title, start_offset, is_url, srt_path in files
+        ]
+        self._rebuild_offsets()
+        self._resolve_abs_paths()
         
         # Clear any lingering status from a previous book or show loading for URLs
         if any(f.get('is_url') for f in self.files_list):
@@ -136,16 +228,9 @@ class PlaybackController:
             self.current_file_index = max(0, min(saved_file_index or 0, len(self.files_list) - 1))
             self.calculate_global_position()
             
-            # Resolve path relative to library root
             file_info = self.files_list[self.current_file_index]
-            rel_file_path = file_info['path']
             is_url = file_info.get('is_url', False)
-            if is_url:
-                abs_file_path = rel_file_path
-            elif self.library_root:
-                abs_file_path = str(self.library_root / rel_file_path)
-            else:
-                abs_file_path = rel_file_path
+            abs_file_path = self._abs_path(file_info)
 
             if is_url:
                 # Async path: do not block the UI
@@ -231,7 +316,8 @@ class PlaybackController:
             actual_dur = self.player.get_duration()
             if actual_dur > 0:
                 file_info['duration'] = actual_dur
-                self.total_duration = sum(f['duration'] for f in self.files_list)
+                self._rebuild_offsets()
+                self.total_duration = self._cum_offsets[-1]
                 if self.db and audiobook_id:
                     self.db.update_file_duration(
                         audiobook_id=audiobook_id,
@@ -364,13 +450,7 @@ class PlaybackController:
         file_info = self.files_list[index]
         is_url = file_info.get('is_url', False)
         
-        # Resolve absolute file path
-        if is_url:
-            abs_file_path = file_info['path']
-        elif self.library_root:
-            abs_file_path = str(self.library_root / file_info['path'])
-        else:
-            abs_file_path = file_info['path']
+        abs_file_path = self._abs_path(file_info)
 
         if is_url:
             # Async path for URL tracks
@@ -399,7 +479,8 @@ class PlaybackController:
                 actual_dur = self.player.get_duration()
                 if actual_dur > 0:
                     file_info['duration'] = actual_dur
-                    self.total_duration = sum(f['duration'] for f in self.files_list)
+                    self._rebuild_offsets()
+                    self.total_duration = self._cum_offsets[-1]
                     if self.db and self.current_audiobook_id:
                         self.db.update_file_duration(
                             audiobook_id=self.current_audiobook_id,
@@ -424,10 +505,8 @@ class PlaybackController:
     def next_file(self, auto_next: bool = True) -> bool:
         """Switch to the next sequential file in the collection"""
         if self.current_file_index < len(self.files_list) - 1:
-            self.play_file_at_index(
-                self.current_file_index + 1, 
-                self.player.is_playing() or auto_next
-            )
+            # play_file_at_index keeps playing if the player was already playing
+            self.play_file_at_index(self.current_file_index + 1, auto_next)
             self.save_current_progress()
             return True
         else:
@@ -435,6 +514,8 @@ class PlaybackController:
             self.player.stop()
             
             if self.current_audiobook_id and self.total_duration > 0:
+                # Write pending progress first so a later flush cannot overwrite the 100% mark
+                self.flush_progress()
                 self.db.mark_audiobook_completed(
                     self.current_audiobook_id, 
                     self.total_duration
@@ -455,42 +536,95 @@ class PlaybackController:
             return True
         elif self.current_file_index > 0:
             # Otherwise, go back to the previous file
-            self.play_file_at_index(
-                self.current_file_index - 1, 
-                self.player.is_playing()
-            )
+            # Resumes playback only if it was playing (checked inside play_file_at_index)
+            self.play_file_at_index(self.current_file_index - 1, False)
             self.save_current_progress()
             return True
         return False
     
+    def _rebuild_offsets(self):
+        """Recompute the cumulative start offset of every file in files_list"""
+        acc = 0.0
+        offsets = [0.0]
+        for f in self.files_list:
+            acc += f['duration'] or 0
+            offsets.append(acc)
+        self._cum_offsets = offsets
+        self._cum_offsets_source = self.files_list
+    
+    def _resolve_abs_paths(self):
+        """Store the absolute path of every file in files_list under the 'abs' key"""
+        root = self.library_root
+        for f in self.files_list:
+            if f.get('is_url') or not root:
+                f['abs'] = f['path']
+            else:
+                f['abs'] = str(root / f['path'])
+        self._abs_paths_root = root
+        self._abs_paths_source = self.files_list
+    
+    def _abs_path(self, file_info: Dict) -> str:
+        """Return the absolute path of a files_list entry without re-joining it on every switch"""
+        # Re-resolve if files_list was replaced or the library root changed since load
+        if self._abs_paths_source is not self.files_list or \
+           self._abs_paths_root is not self.library_root or 'abs' not in file_info:
+            self._resolve_abs_paths()
+        return file_info['abs']
+    
+    def _ensure_offsets(self):
+        """Rebuild the prefix sums if files_list was replaced from outside (e.g. when a book is unloaded)"""
+        if self._cum_offsets_source is not self.files_list or \
+           len(self._cum_offsets) != len(self.files_list) + 1:
+            self._rebuild_offsets()
+    
+    def _file_index_by_name(self, file_name: str) -> int:
+        """Return the index of the first file in files_list with this name, or -1"""
+        if self._name_to_index_source is not self.files_list:
+            name_to_index = {}
+            for i, f in enumerate(self.files_list):
+                name_to_index.setdefault(f['name'], i)
+            self._name_to_index = name_to_index
+            self._name_to_index_source = self.files_list
+        return self._name_to_index.get(file_name, -1)
+    
     def calculate_global_position(self):
         """Update the aggregate duration of all files preceding the current one"""
-        self.global_position = sum(
-            f['duration'] for f in self.files_list[:self.current_file_index]
-        )
+        self._ensure_offsets()
+        index = max(0, min(self.current_file_index, len(self.files_list)))
+        self.global_position = self._cum_offsets[index]
     
-    def get_current_position(self) -> float:
-        """Calculate the total elapsed time across the entire audiobook"""
+    def get_current_position(self, position: Optional[float] = None) -> float:
+        """Calculate the total elapsed time across the entire audiobook.
+
+        position is the player position within the current file, if the
+        caller has already read it.
+        """
         # total_pos = sum(durations of previous virtual files) + (current_physical_pos - chapter_start_offset)
+        if position is None:
+            position = self.player.get_position()
         current_file_info = self.files_list[self.current_file_index]
         start_offset = current_file_info.get('start_offset', 0)
-        return self.global_position + max(0, self.player.get_position() - start_offset)
+        return self.global_position + max(0, position - start_offset)
     
-    def get_progress_percent(self) -> int:
-        """Calculate the current playback progress as a percentage (0-100)"""
-        if self.total_duration <= 0:
+    def get_progress_percent(self, current: Optional[float] = None) -> int:
+        """Calculate the current playback progress as a percentage (0-100).
+
+        current is the value of get_current_position(), if already known.
+        """
+        if self._percent_scale == 0.0:
             return 0
-            
-        current = self.get_current_position()
+        
+        if current is None:
+            current = self.get_current_position()
         
         # Consider finished if within 1 second of total duration
-        if current >= self.total_duration - 1:
+        if current >= self._completion_threshold:
             return 100
         
-        return int((current / self.total_duration) * 100)
+        return int(current * self._percent_scale)
     
     def save_current_progress(self, update_timestamp: bool = True):
-        """Commit current playback state and accumulated metrics to the database"""
+        """Record current playback state; the DB write is deferred and coalesced (see flush_progress)"""
         if not self.current_audiobook_id:
             return
         
@@ -499,41 +633,89 @@ class PlaybackController:
         if getattr(self, '_url_loading', False):
             return
         
+        # One player read for all three values
         position = self.player.get_position()
         speed = self.player.speed_pos / 10.0
-        listened_duration = self.get_current_position()
-        progress_percent = self.get_progress_percent()
+        listened_duration = self.get_current_position(position)
+        progress_percent = self.get_progress_percent(listened_duration)
+        
+        pending = self._pending_progress
+        if pending is not None:
+            if pending[0] != self.current_audiobook_id:
+                self.flush_progress()
+            else:
+                # A coalesced earlier save would have bumped the timestamp on its own
+                update_timestamp = update_timestamp or pending[-1]
         
-        self.db.save_progress(
+        self._pending_progress = (
             self.current_audiobook_id,
             self.current_file_index,
             position,
             speed,
             listened_duration,
             progress_percent,
-            update_timestamp=update_timestamp
+            update_timestamp
         )
+        self.flush_progress(only_if_due=True)
         
         # Pause listening session when saving progress (e.g., on pause)
         if self.listening_tracker and update_timestamp:
             self.listening_tracker.pause_session()
+    
+    def flush_progress(self, only_if_due: bool = False):
+        """Write pending progress to the database.
+
+        With only_if_due, the write happens only once progress_flush_interval
+        has passed since the previous one, and runs on a background thread.
+        Otherwise it is written synchronously (book switch, pause, exit), after
+        any background write still in flight so the two cannot reorder.
+        """
+        if not only_if_due:
+            self.wait_for_background_save()
+        pending = self._pending_progress
+        if pending is None:
+            return
+        now = time.monotonic()
+        if only_if_due:
+            if now - self._last_flush_time < self.progress_flush_interval:
+                return
+            if self._save_thread is not None and self._save_thread.isRunning():
+                # Keep the snapshot pending; the next due flush picks it up
+                return
+            self._pending_progress = None
+            self._last_flush_time = now
+            thread = ProgressSaveThread(self.db, pending)
+            if self.on_progress_saved is not None:
+                thread.finished.connect(self.on_progress_saved)
+            self._save_thread = thread
+            thread.start()
+            return
         
-        # Update library if we are in a recency-sensitive view
-        if hasattr(self, 'parent_app') and hasattr(self.parent_app, 'library_widget') and \
-           self.parent_app.library_widget.current_filter == 'in_progress':
-            self.parent_app.library_widget.refresh_audiobook_item(self.current_audiobook_path)
+        self._pending_progress = None
+        self._last_flush_time = now
+        *args, update_timestamp = pending
+        self.db.save_progress(*args, update_timestamp=update_timestamp)
+    
+    def get_unsaved_progress(self) -> Optional[Tuple[float, int]]:
+        """Return (listened_duration, progress_percent) of the current book that is not in the database yet, or None"""
+        snapshot = self._pending_progress
+        if snapshot is None and self._save_thread is not None and self._save_thread.isRunning():
+            snapshot = self._save_thread.pending
+        if snapshot is None or snapshot[0] != self.current_audiobook_id:
+            return None
+        return snapshot[4], snapshot[5]
+    
+    def wait_for_background_save(self):
+        """Block until the in-flight background progress write (if any) has finished"""
+        if self._save_thread is not None:
+            self._save_thread.wait()
     
     def get_audiobook_title(self) -> str:
         """Fetch the displayable name for the currently playing audiobook"""
         if not self.current_audiobook_path:
             return "Audiobook Player"
-            
-        info = self.db.get_audiobook_info(self.current_audiobook_path)
-        if info:
-            # info contains 12 fields (including description and covers)
-            _, name, author, title, _, _, _, _, _, _, _, _ = info
-            return name
-        return "Audiobook Player"
+        # Name is cached by load_audiobook, no need to query the database again
+        return self._cached_name or "Audiobook Player"
 
     def add_current_as_bookmark(self, title: str, description: str = "") -> bool:
         """Save the current playback position as a bookmark"""
@@ -546,7 +728,7 @@ class PlaybackController:
         
         # If no title provided, generate one from timestamp
         if not title:
-            timestamp = format_time_short(self.get_current_position())
+            timestamp = format_time_short(self.get_current_position(position))
             title = f"{tr('bookmarks.bookmark_at')} {timestamp}"
             
         return self.db.add_bookmark(
@@ -559,18 +741,13 @@ class PlaybackController:
 
     def jump_to_bookmark(self, bookmark_id: int) -> bool:
         """Resume playback from a specific bookmark"""
-        bookmarks = self.db.get_bookmarks(self.current_audiobook_id)
-        target_bookmark = next((b for b in bookmarks if b['id'] == bookmark_id), None)
+        target_bookmark = self.db.get_bookmark(bookmark_id)
         
-        if not target_bookmark:
+        if not target_bookmark or target_bookmark['audiobook_id'] != self.current_audiobook_id:
             return False
             
         # Find the file index matching the bookmark's file name
-        target_file_index = -1
-        for i, file_info in enumerate(self.files_list):
-            if file_info['name'] == target_bookmark['file_name']:
-                target_file_index = i
-                break
+        target_file_index = self._file_index_by_name(target_bookmark['file_name'])
                 
         if target_file_index == -1:
             return False
@@ -591,18 +768,15 @@ class PlaybackController:
         if not bookmarks:
             return []
             
+        self._ensure_offsets()
         percentages = []
         for b in bookmarks:
-            file_name = b['file_name']
-            time_position = b['time_position']
-            
-            file_start_pos = 0.0
-            for f in self.files_list:
-                if f['name'] == file_name:
-                    bookmark_global_pos = file_start_pos + max(0, time_position - f.get('start_offset', 0))
-                    percentages.append(bookmark_global_pos / self.total_duration)
-                    break
-                file_start_pos += f['duration']
+            index = self._file_index_by_name(b['file_name'])
+            if index == -1:
+                continue
+            f = self.files_list[index]
+            bookmark_global_pos = self._cum_offsets[index] + max(0, b['time_position'] - f.get('start_offset', 0))
+            percentages.append(bookmark_global_pos / self.total_duration)
                 
         return percentages
 
@@ -612,24 +786,49 @@ class ClickableSlider(QSlider):
     
     def __init__(self, orientation=Qt.Orientation.Horizontal):
         super().__init__(orientation)
+        # Handle length from the style; recomputed lazily after style changes/resizes
+        self._slider_len: Optional[int] = None
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.StyleChange:
+            self._slider_len = None
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._slider_len = None
+        super().resizeEvent(event)
+
+    def _get_slider_len(self) -> int:
+        if self._slider_len is None:
+            opt = QStyleOptionSlider()
+            self.initStyleOption(opt)
+            self._slider_len = self.style().pixelMetric(QStyle.PixelMetric.PM_SliderLength, opt, self)
+        return self._slider_len
 
     def mousePressEvent(self, event):
         """Handle mouse click to jump to value"""
         if event.button() == Qt.MouseButton.LeftButton:
             val = self.pixelPosToRangeValue(event.pos())
-            self.setValue(val)
-            self.sliderMoved.emit(val)  # Emit signal continuously
-            self.sliderPressed.emit() # Inform about start of interaction 
+            self.setValue(val)  # the only valueChanged for this click
+            # The base handler starts the handle drag; keep its own pressed/page-step
+            # notifications quiet so listeners hear about the click exactly once
+            self.blockSignals(True)
+            try:
+                super().mousePressEvent(event)
+                if self.value() != val:
+                    self.setValue(val)
+            finally:
+                self.blockSignals(False)
+            self.sliderPressed.emit()  # Inform about start of interaction
+            self.sliderMoved.emit(val)
             event.accept()
+            return
         super().mousePressEvent(event)
         
     def pixelPosToRangeValue(self, pos):
         """Convert pixel coordinate to slider value"""
-        opt = QStyleOptionSlider()
-        self.initStyleOption(opt)
-        
         # Calculate available slider length
-        slider_len = self.style().pixelMetric(QStyle.PixelMetric.PM_SliderLength, opt, self)
+        slider_len = self._get_slider_len()
         available_width = self.width() - slider_len
         
         if available_width <= 0:
@@ -640,10 +839,10 @@ class ClickableSlider(QSlider):
         pos_x = max(0, min(pos_x, available_width))
         
         # Map to range
-        range_val = self.maximum() - self.minimum()
-        val = self.minimum() + (pos_x / available_width) * range_val
+        minimum, maximum = self.minimum(), self.maximum()
+        val = minimum + (pos_x * (maximum - minimum)) // available_width
         
-        return int(max(self.minimum(), min(self.maximum(), val)))
+        return max(minimum, min(maximum, val))
 
 
 class BookProgressBar(QProgressBar):
@@ -719,12 +918,31 @@ class PlayerWidget(QWidget):
     add_bookmark_clicked = pyqtSignal()
     subtitles_toggled_signal = pyqtSignal(bool)
     
+    SLIDER_EMIT_INTERVAL_MS = 33
+    
+    # Checkable 40px buttons of the settings row:
+    # (attribute, objectName, label key, tooltip key, toggled slot, right-click popup slot)
+    LEADING_TOGGLE_BUTTONS = (
+        ("id3_btn", "id3Btn", "player.btn_id3", "player.show_id3", "on_id3_toggled", None),
+        ("subtitles_btn", "subtitlesBtn", "player.btn_subtitles", "player.show_subtitles", "_on_subtitles_toggled", None),
+        ("auto_rewind_btn", "autoRewindBtn", "player.btn_autorewind", "player.tooltip_auto_rewind", "on_auto_rewind_toggled", None),
+    )
+    EFFECT_TOGGLE_BUTTONS = (
+        ("volume_boost_btn", "volumeBoostBtn", "player.btn_volume_boost", "player.tooltip_volume_boost", "on_volume_boost_toggled", "show_volume_boost_popup"),
+        ("deesser_btn", "deesserBtn", "player.btn_deesser", "player.tooltip_deesser", "on_deesser_toggled", "show_deesser_popup"),
+        ("compressor_btn", "compressorBtn", "player.btn_compressor", "player.tooltip_compressor", "on_compressor_toggled", "show_compressor_popup"),
+        ("noise_suppression_btn", "noiseSuppressionBtn", "player.btn_noise_suppression", "player.tooltip_noise_suppression", "on_noise_suppression_toggled", "show_vad_slider_popup"),
+        ("pitch_btn", "pitchBtn", "player.btn_pitch", "player.tooltip_pitch", "on_pitch_toggled", "show_pitch_popup"),
+        ("mono_btn", "monoBtn", "player.btn_mono", "player.tooltip_mono", "on_mono_toggled", None),
+    )
+    
     def __init__(self):
         """Initialize widget state and prepare basic icon properties"""
         super().__init__()
         self.show_id3 = False
         self.visualizer = None # Deprecated
         self.slider_dragging = False
+        self._pending_seek_value: Optional[int] = None  # latest sliderMoved value not yet shown
         self.current_file_duration = 0.0
         self.current_speed = 1.0
         
@@ -732,10 +950,61 @@ class PlayerWidget(QWidget):
         self.deesser_preset = 1
         self.compressor_preset = 1
         self.volume_boost_level = 4.0  # 400%
+        self.vad_threshold = 90
+        self.vad_grace = 20
+        self.vad_retro = 0
+        self.pitch_semitones = 0.0
+        
+        # Effect popups, created on first open; setters only store the values until then
+        self.vad_popup: Optional[QWidget] = None
+        self.deesser_popup: Optional[QWidget] = None
+        self.compressor_popup: Optional[QWidget] = None
+        self.pitch_popup: Optional[QWidget] = None
+        self.volume_boost_popup: Optional[QWidget] = None
+        
+        # Speed and effect slider drags emit many values per second and every
+        # receiver re-applies DSP and persists the value; forward at most one
+        # value per signal every SLIDER_EMIT_INTERVAL_MS (labels still update
+        # per tick) and deliver the final value as soon as the handle is released
+        self._pending_slider_values: Dict[str, object] = {}
+        self._slider_emit_timer = QTimer(self)
+        self._slider_emit_timer.setSingleShot(True)
+        self._slider_emit_timer.setInterval(self.SLIDER_EMIT_INTERVAL_MS)
+        self._slider_emit_timer.timeout.connect(self._emit_pending_slider_values)
         
         # Icon resources
         self.play_icon = None
         self.pause_icon = None
+        # Play/pause state currently shown on play_btn (None: not yet applied)
+        self._shown_playing: Optional[bool] = None
+        
+        # Raw translation templates for per-tick formatting, cleared on language change
+        self._templates: Dict[str, str] = {}
+        # Last (whole-second key, text) per progress label; ticks arrive several
+        # times a second but the text only changes once per second.
+        # Cleared on language change
+        self._tick_texts: Dict[str, tuple] = {}
+        # (current, total, speed) last shown by update_total_progress; while
+        # paused every tick repeats it
+        self._last_total_args: Optional[tuple] = None
+        # Light/Medium/Strong preset names and the pitch unit, cleared on language change
+        self._preset_labels: Optional[tuple] = None
+        self._pitch_suffix: Optional[str] = None
+        
+        # Row currently marked as playing in file_list
+        self._highlighted_index: Optional[int] = None
+        # Files shown in file_list, kept for in-place relabelling
+        self.last_files_list: list = []
+        # Splitter layout saved while the subtitle panel is hidden
+        self._saved_splitter_state = None
+        # Last state shown by set_noise_suppression_active
+        self._noise_suppression_active = False
+        # Shared fonts for the playing/regular rows. Only the bold flag is set,
+        # so family and size still resolve from the list's own font/stylesheet
+        self._font_bold = QFont()
+        self._font_bold.setBold(True)
+        self._font_regular = QFont()
+        self._font_regular.setBold(False)
         
         self.setup_ui()
         self.load_icons()
@@ -766,32 +1035,8 @@ class PlayerWidget(QWidget):
         
         icon_size = QSize(20, 20) # Added as per instruction
         
-        # ID3 Meta-tag Toggle
-        self.id3_btn = QPushButton(tr("player.btn_id3"))
-        self.id3_btn.setCheckable(True)
-        self.id3_btn.setFixedWidth(40)
-        self.id3_btn.setObjectName("id3Btn")
-        self.id3_btn.setToolTip(tr("player.show_id3"))
-        self.id3_btn.toggled.connect(self.on_id3_toggled)
-        btns_row.addWidget(self.id3_btn)
-        
-        # Subtitles Toggle
-        self.subtitles_btn = QPushButton(tr("player.btn_subtitles"))
-        self.subtitles_btn.setCheckable(True)
-        self.subtitles_btn.setFixedWidth(40)
-        self.subtitles_btn.setObjectName("subtitlesBtn")
-        self.subtitles_btn.setToolTip(tr("player.show_subtitles"))
-        self.subtitles_btn.toggled.connect(self._on_subtitles_toggled)
-        btns_row.addWidget(self.subtitles_btn)
-        
-        # Auto-rewind Toggle
-        self.auto_rewind_btn = QPushButton(tr("player.btn_autorewind"))
-        self.auto_rewind_btn.setCheckable(True)
-        self.auto_rewind_btn.setFixedWidth(40)
-        self.auto_rewind_btn.setObjectName("autoRewindBtn")
-        self.auto_rewind_btn.setToolTip(tr("player.tooltip_auto_rewind"))
-        self.auto_rewind_btn.toggled.connect(self.on_auto_rewind_toggled)
-        btns_row.addWidget(self.auto_rewind_btn)
+        # ID3 / Subtitles / Auto-rewind toggles
+        self._add_toggle_buttons(btns_row, self.LEADING_TOGGLE_BUTTONS)
 
         # Bookmarks container widget to group list and add button flush together and prevent overlap on resize
         bookmarks_container = QWidget()
@@ -824,199 +1069,12 @@ class PlayerWidget(QWidget):
 
         btns_row.addStretch()
         
-        # Volume Boost Toggle
-        self.volume_boost_btn = QPushButton(tr("player.btn_volume_boost"))
-        self.volume_boost_btn.setCheckable(True)
-        self.volume_boost_btn.setFixedWidth(40)
-        self.volume_boost_btn.setObjectName("volumeBoostBtn")
-        self.volume_boost_btn.setToolTip(tr("player.tooltip_volume_boost"))
-        self.volume_boost_btn.toggled.connect(self.on_volume_boost_toggled)
-        # Right-click for Volume Boost level
-        self.volume_boost_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.volume_boost_btn.customContextMenuRequested.connect(self.show_volume_boost_popup)
-        btns_row.addWidget(self.volume_boost_btn)
-        
-        # DeEsser Toggle
-        self.deesser_btn = QPushButton(tr("player.btn_deesser"))
-        self.deesser_btn.setCheckable(True)
-        self.deesser_btn.setFixedWidth(40)
-        self.deesser_btn.setObjectName("deesserBtn")
-        self.deesser_btn.setToolTip(tr("player.tooltip_deesser"))
-        self.deesser_btn.toggled.connect(self.on_deesser_toggled)
-        # Right-click for DeEsser presets
-        self.deesser_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.deesser_btn.customContextMenuRequested.connect(self.show_deesser_popup)
-        btns_row.addWidget(self.deesser_btn)
-        
-        self.compressor_btn = QPushButton(tr("player.btn_compressor"))
-        self.compressor_btn.setCheckable(True)
-        self.compressor_btn.setFixedWidth(40)
-        self.compressor_btn.setObjectName("compressorBtn")
-        self.compressor_btn.setToolTip(tr("player.tooltip_compressor"))
-        self.compressor_btn.toggled.connect(self.on_compressor_toggled)
-        # Right-click for Compressor presets
-        self.compressor_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.compressor_btn.customContextMenuRequested.connect(self.show_compressor_popup)
-        btns_row.addWidget(self.compressor_btn)
-        
-        # Noise Suppression Toggle
-        self.noise_suppression_btn = QPushButton(tr("player.btn_noise_suppression"))
-        self.noise_suppression_btn.setCheckable(True)
-        self.noise_suppression_btn.setFixedWidth(40)
-        self.noise_suppression_btn.setObjectName("noiseSuppressionBtn")
-        self.noise_suppression_btn.setToolTip(tr("player.tooltip_noise_suppression"))
-        self.noise_suppression_btn.toggled.connect(self.on_noise_suppression_toggled)
-        # Right-click for VAD threshold popup
-        self.noise_suppression_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.noise_suppression_btn.customContextMenuRequested.connect(self.show_vad_slider_popup)
-        btns_row.addWidget(self.noise_suppression_btn)
-        
-        # Pitch Toggle
-        self.pitch_btn = QPushButton(tr("player.btn_pitch"))
-        self.pitch_btn.setCheckable(True)
-        self.pitch_btn.setFixedWidth(40)
-        self.pitch_btn.setObjectName("pitchBtn")
-        self.pitch_btn.setToolTip(tr("player.tooltip_pitch"))
-        self.pitch_btn.toggled.connect(self.on_pitch_toggled)
-        # Right-click for Pitch settings
-        self.pitch_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.pitch_btn.customContextMenuRequested.connect(self.show_pitch_popup)
-        btns_row.addWidget(self.pitch_btn)
-        
-        # Mono Toggle
-        self.mono_btn = QPushButton(tr("player.btn_mono"))
-        self.mono_btn.setCheckable(True)
-        self.mono_btn.setFixedWidth(40)
-        self.mono_btn.setObjectName("monoBtn")
-        self.mono_btn.setToolTip(tr("player.tooltip_mono"))
-        self.mono_btn.toggled.connect(self.on_mono_toggled)
-        btns_row.addWidget(self.mono_btn)
-        
-        # VAD Threshold Popup (Advanced Settings)
-        self.vad_popup = QWidget(self, Qt.WindowType.Popup)
-        self.vad_popup.setObjectName("vadPopup")
-        vad_layout = QGridLayout(self.vad_popup)
-        vad_layout.setContentsMargins(8, 8, 8, 8)
-        vad_layout.setSpacing(8)
-        
-        # 1. Sensitivity (Threshold)
-        self.vad_sens_label_title = QLabel(tr("player.vad_sens_label"))
-        vad_layout.addWidget(self.vad_sens_label_title, 0, 0)
-        self.vad_slider = QSlider(Qt.Orientation.Horizontal)
-        self.vad_slider.setRange(0, 100)
-        self.vad_slider.setValue(90)
-        self.vad_slider.setFixedWidth(120)
-        self.vad_slider.setToolTip(tr("player.tooltip_vad_threshold"))
-        self.vad_slider.valueChanged.connect(self.on_vad_threshold_changed)
-        vad_layout.addWidget(self.vad_slider, 0, 1)
-        self.vad_label = QLabel("90%")
-        self.vad_label.setFixedWidth(35)
-        vad_layout.addWidget(self.vad_label, 0, 2)
-        
-        # 2. Grace Period
-        self.vad_grace_label_title = QLabel(tr("player.vad_grace_label"))
-        vad_layout.addWidget(self.vad_grace_label_title, 1, 0)
-        self.vad_grace_slider = QSlider(Qt.Orientation.Horizontal)
-        self.vad_grace_slider.setRange(0, 100) # 0-100% (arbitrary scale)
-        self.vad_grace_slider.setValue(20)
-        self.vad_grace_slider.setFixedWidth(120)
-        self.vad_grace_slider.setToolTip(tr("player.tooltip_vad_grace"))
-        self.vad_grace_slider.valueChanged.connect(self.on_vad_grace_changed)
-        vad_layout.addWidget(self.vad_grace_slider, 1, 1)
-        self.vad_grace_label = QLabel("20%")
-        self.vad_grace_label.setFixedWidth(35)
-        vad_layout.addWidget(self.vad_grace_label, 1, 2)
-        
-        # 3. Retroactive Grace
-        self.vad_retro_label_title = QLabel(tr("player.vad_retro_label"))
-        vad_layout.addWidget(self.vad_retro_label_title, 2, 0)
-        self.vad_retro_slider = QSlider(Qt.Orientation.Horizontal)
-        self.vad_retro_slider.setRange(0, 100)
-        self.vad_retro_slider.setValue(0)
-        self.vad_retro_slider.setFixedWidth(120)
-        self.vad_retro_slider.setToolTip(tr("player.tooltip_vad_retro"))
-        self.vad_retro_slider.valueChanged.connect(self.on_vad_retro_changed)
-        vad_layout.addWidget(self.vad_retro_slider, 2, 1)
-        self.vad_retro_label = QLabel("0%")
-        self.vad_retro_label.setFixedWidth(35)
-        vad_layout.addWidget(self.vad_retro_label, 2, 2)
-        
-        # DeEsser Preset Popup
-        self.deesser_popup = QWidget(self, Qt.WindowType.Popup)
-        self.deesser_popup.setObjectName("deesserPopup")
-        deesser_layout = QHBoxLayout(self.deesser_popup)
-        deesser_layout.setContentsMargins(8, 4, 8, 4)
-        
-        self.deesser_slider = QSlider(Qt.Orientation.Horizontal)
-        self.deesser_slider.setRange(0, 2) # 0=Light, 1=Medium, 2=Strong
-        self.deesser_slider.setValue(1)
-        self.deesser_slider.setFixedWidth(80)
-        self.deesser_slider.valueChanged.connect(self.on_deesser_preset_changed)
-        deesser_layout.addWidget(self.deesser_slider)
-        
-        self.deesser_desc_label = QLabel(tr("player.preset_medium")) # Default
-        self.deesser_desc_label.setFixedWidth(60)
-        self.deesser_desc_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        deesser_layout.addWidget(self.deesser_desc_label)
-        
-        # Compressor Preset Popup
-        self.compressor_popup = QWidget(self, Qt.WindowType.Popup)
-        self.compressor_popup.setObjectName("compressorPopup")
-        comp_layout = QHBoxLayout(self.compressor_popup)
-        comp_layout.setContentsMargins(8, 4, 8, 4)
-        
-        self.comp_slider = QSlider(Qt.Orientation.Horizontal)
-        self.comp_slider.setRange(0, 2) # 0=Light, 1=Medium, 2=Strong
-        self.comp_slider.setValue(1)
-        self.comp_slider.setFixedWidth(80)
-        self.comp_slider.valueChanged.connect(self.on_compressor_preset_changed)
-        comp_layout.addWidget(self.comp_slider)
-        
-        self.comp_desc_label = QLabel(tr("player.preset_medium")) # Default
-        self.comp_desc_label.setFixedWidth(60)
-        self.comp_desc_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        comp_layout.addWidget(self.comp_desc_label)
-        
-        # Pitch Popup
-        self.pitch_popup = QWidget(self, Qt.WindowType.Popup)
-        self.pitch_popup.setObjectName("pitchPopup")
-        pitch_layout = QHBoxLayout(self.pitch_popup)
-        pitch_layout.setContentsMargins(8, 4, 8, 4)
-        
-        self.pitch_slider = QSlider(Qt.Orientation.Horizontal)
-        self.pitch_slider.setRange(-120, 120) # -12.0 to +12.0 semitones
-        self.pitch_slider.setValue(0)
-        self.pitch_slider.setFixedWidth(120)
-        self.pitch_slider.valueChanged.connect(self.on_pitch_slider_changed)
-        pitch_layout.addWidget(self.pitch_slider)
-        
-        self.pitch_val_label = QLabel(f"0.0 {tr('player.pitch_label')}")
-        self.pitch_val_label.setFixedWidth(60)
-        self.pitch_val_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        pitch_layout.addWidget(self.pitch_val_label)
-        
-        # Volume Boost Popup
-        self.volume_boost_popup = QWidget(self, Qt.WindowType.Popup)
-        self.volume_boost_popup.setObjectName("volumeBoostPopup")
-        vb_layout = QHBoxLayout(self.volume_boost_popup)
-        vb_layout.setContentsMargins(8, 4, 8, 4)
+        # Effect toggles; right-click opens the effect's settings popup
+        self._add_toggle_buttons(btns_row, self.EFFECT_TOGGLE_BUTTONS)
         
-        self.volume_boost_slider = QSlider(Qt.Orientation.Horizontal)
-        self.volume_boost_slider.setRange(200, 400)  # 200% to 400%
-        self.volume_boost_slider.setValue(400)  # Default 400%
-        self.volume_boost_slider.setSingleStep(100)
-        self.volume_boost_slider.setPageStep(100)
-        self.volume_boost_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.volume_boost_slider.setTickInterval(100)
-        self.volume_boost_slider.setFixedWidth(120)
-        self.volume_boost_slider.valueChanged.connect(self.on_volume_boost_level_changed)
-        vb_layout.addWidget(self.volume_boost_slider)
+        # Effect popups (VAD, DeEsser, Compressor, Pitch, Volume Boost) are built
+        # on first right-click, see _ensure_*_popup
         
-        self.volume_boost_label = QLabel("400%")
-        self.volume_boost_label.setFixedWidth(50)
-        self.volume_boost_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        vb_layout.addWidget(self.volume_boost_label)
-
         settings_layout.addLayout(btns_row)
         
         # Sliders Row (Volume + Speed)
@@ -1031,14 +1089,14 @@ class PlayerWidget(QWidget):
         self.volume_slider.valueChanged.connect(self.on_volume_changed)
         sliders_row.addWidget(self.volume_slider)
         
-        self.volume_label = QLabel(trf("formats.percent", value=100))
+        self.volume_label = QLabel(self._fmt("formats.percent", value=100))
         self.volume_label.setMinimumWidth(45)
         sliders_row.addWidget(self.volume_label)
         
         sliders_row.addStretch()
         
         # Speed
-        self.speed_label = QLabel(trf("formats.speed", value=1.0))
+        self.speed_label = QLabel(self._fmt("formats.speed", value=1.0))
         self.speed_label.setFixedWidth(35)
         sliders_row.addWidget(self.speed_label)
         
@@ -1048,6 +1106,7 @@ class PlayerWidget(QWidget):
         self.speed_slider.setMinimumWidth(100)
         self.speed_slider.setToolTip(tr("player.speed"))
         self.speed_slider.valueChanged.connect(self.on_speed_changed)
+        self.speed_slider.sliderReleased.connect(self._emit_pending_slider_values)
         sliders_row.addWidget(self.speed_slider)
         
         settings_layout.addLayout(sliders_row)
@@ -1126,7 +1185,7 @@ class PlayerWidget(QWidget):
         total_box.setSpacing(8)
         
         total_times = QHBoxLayout()
-        self.total_percent_label = QLabel(trf("formats.percent", value=0))
+        self.total_percent_label = QLabel(self._fmt("formats.percent", value=0))
         self.total_percent_label.setObjectName("timeLabel")
         self.total_time_label = QLabel("0:00:00")
         self.total_time_label.setObjectName("timeLabel")
@@ -1164,6 +1223,12 @@ class PlayerWidget(QWidget):
         self.file_list.setObjectName("fileList")
         self.file_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
         self.file_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Rows are single-line text of one height: skip per-item size hints and
+        # lay out long track lists in batches instead of all at once
+        self.file_list.setSortingEnabled(False)  # rows stay in track order
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.file_list.setBatchSize(100)
         self.file_list.itemDoubleClicked.connect(self.on_file_double_clicked)
         self.splitter.addWidget(self.file_list)
         
@@ -1180,6 +1245,31 @@ class PlayerWidget(QWidget):
         self.seek_tooltip.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.seek_tooltip.hide()
     
+    def _fmt(self, key: str, **kwargs) -> str:
+        """Format a translation template, looking the template up once per language"""
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = tr(key)
+        try:
+            return template.format(**kwargs)
+        except Exception:
+            return template
+    
+    def _add_toggle_buttons(self, layout: QHBoxLayout, specs: tuple):
+        """Create the checkable settings-row buttons described by specs and add them to layout"""
+        for attr, object_name, label_key, tooltip_key, slot, popup_slot in specs:
+            btn = QPushButton(tr(label_key))
+            btn.setCheckable(True)
+            btn.setFixedWidth(40)
+            btn.setObjectName(object_name)
+            btn.setToolTip(tr(tooltip_key))
+            btn.toggled.connect(getattr(self, slot))
+            if popup_slot:
+                btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+                btn.customContextMenuRequested.connect(getattr(self, popup_slot))
+            layout.addWidget(btn)
+            setattr(self, attr, btn)
+    
     def create_button(self, object_name: str, tooltip: str, icon_size: QSize) -> QPushButton:
         btn = QPushButton()
         btn.setObjectName(object_name)
@@ -1193,6 +1283,7 @@ class PlayerWidget(QWidget):
         self.pause_icon = get_icon("pause")
         
         self.play_btn.setIcon(self.play_icon)
+        self._shown_playing = None  # re-apply pause icon on the next tick if playing
         self.btn_prev.setIcon(get_icon("prev"))
         self.btn_next.setIcon(get_icon("next"))
         self.btn_rw10.setIcon(get_icon("rewind_10"))
@@ -1201,12 +1292,12 @@ class PlayerWidget(QWidget):
         self.btn_ff60.setIcon(get_icon("forward_60"))
     
     def on_volume_changed(self, value: int):
-        self.volume_label.setText(trf("formats.percent", value=value))
+        self.volume_label.setText(self._fmt("formats.percent", value=value))
         self.volume_changed.emit(value)
     
     def on_speed_changed(self, value: int):
-        self.speed_label.setText(trf("formats.speed", value=value/10))
-        self.speed_changed.emit(value)
+        self.speed_label.setText(self._fmt("formats.speed", value=value/10))
+        self._queue_slider_value('speed_changed', value)
     
     def on_position_pressed(self):
         if self.current_file_duration <= 0:
@@ -1226,6 +1317,16 @@ class PlayerWidget(QWidget):
     def on_position_moved(self, value: int):
         if self.current_file_duration <= 0:
             return
+        # A drag delivers bursts of sliderMoved; lay out the tooltip once per event-loop pass
+        if self._pending_seek_value is None:
+            QTimer.singleShot(0, self._apply_pending_seek_tooltip)
+        self._pending_seek_value = value
+    
+    def _apply_pending_seek_tooltip(self):
+        value = self._pending_seek_value
+        self._pending_seek_value = None
+        if value is None or not self.position_slider.isSliderDown():
+            return
         self._update_seek_tooltip(value)
         self.seek_tooltip.show()
         
@@ -1280,46 +1381,78 @@ class PlayerWidget(QWidget):
         self.file_selected.emit(index)
     
     def set_playing(self, is_playing: bool):
+        # Called on every UI tick; only touch the button when the state flips
+        if is_playing == self._shown_playing:
+            return
+        self._shown_playing = is_playing
         self.play_btn.setIcon(self.pause_icon if is_playing else self.play_icon)
         self.play_btn.setToolTip(tr("player.pause") if is_playing else tr("player.play"))
     
+    def reset_progress_display(self):
+        """Show zeroed progress, e.g. after the current book was removed"""
+        self._tick_texts.clear()
+        self._last_total_args = None
+        self.position_slider.setValue(0)
+        self.total_progress_bar.setValue(0)
+        self.time_current.setText("0:00")
+        self.time_duration.setText("0:00")
+        self.total_time_label.setText("0:00:00")
+        self.total_duration_label.setText("0:00:00")
+        self.total_percent_label.setText(self._fmt("formats.percent", value=0))
+        self.time_left_label.setText(tr("player.time_left_unknown"))
+    
+    def _time_text(self, slot: str, seconds: float, long_format: bool = True) -> str:
+        """format_time/format_time_short of seconds, reused while the whole second is unchanged"""
+        key = (int(seconds) if seconds > 0 else 0, long_format)
+        cached = self._tick_texts.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = (format_time if long_format else format_time_short)(key[0])
+        self._tick_texts[slot] = (key, text)
+        return text
+    
     def update_file_progress(self, position: float, duration: float, speed: float = 1.0):
         self.current_file_duration = duration
         self.current_speed = speed
+        long_format = duration >= 3600
         if not self.slider_dragging:
             display_pos = position / speed if speed > 0 else position
-            if duration >= 3600:
-                self.time_current.setText(format_time(display_pos))
-            else:
-                self.time_current.setText(format_time_short(display_pos))
+            _set_text_if_changed(self.time_current, self._time_text("current", display_pos, long_format))
                 
             if duration > 0:
-                self.position_slider.setValue(int((position / duration) * 1000))
+                _set_value_if_changed(self.position_slider, int((position / duration) * 1000))
         
         display_dur = duration / speed if speed > 0 else duration
-        if duration >= 3600:
-            self.time_duration.setText(format_time(display_dur))
-        else:
-            self.time_duration.setText(format_time_short(display_dur))
+        _set_text_if_changed(self.time_duration, self._time_text("duration", display_dur, long_format))
     
     def update_total_progress(self, current: float, total: float, speed: float = 1.0):
+        args = (current, total, speed)
+        if args == self._last_total_args:
+            return
+        self._last_total_args = args
         if speed > 0:
-            self.total_time_label.setText(format_time(current / speed))
-            self.total_duration_label.setText(format_time(total / speed))
+            _set_text_if_changed(self.total_time_label, self._time_text("total_current", current / speed))
+            _set_text_if_changed(self.total_duration_label, self._time_text("total_duration", total / speed))
         else:
-            self.total_time_label.setText(format_time(current))
-            self.total_duration_label.setText(format_time(total))
+            _set_text_if_changed(self.total_time_label, self._time_text("total_current", current))
+            _set_text_if_changed(self.total_duration_label, self._time_text("total_duration", total))
         
         if total > 0:
             val = int((current / total) * 10000)
-            self.total_progress_bar.setValue(val)
+            _set_value_if_changed(self.total_progress_bar, val)
             percent = int((current / total) * 100)
-            self.total_percent_label.setText(trf("formats.percent", value=percent))
+            cached = self._tick_texts.get("percent")
+            if cached is None or cached[0] != percent:
+                cached = self._tick_texts["percent"] = (percent, self._fmt("formats.percent", value=percent))
+            _set_text_if_changed(self.total_percent_label, cached[1])
             
-            time_left = (total - current) / speed
-            self.time_left_label.setText(trf("player.time_left", time=format_time(time_left)))
+            time_left = self._time_text("time_left", (total - current) / speed)
+            cached = self._tick_texts.get("time_left_label")
+            if cached is None or cached[0] != time_left:
+                cached = self._tick_texts["time_left_label"] = (time_left, self._fmt("player.time_left", time=time_left))
+            _set_text_if_changed(self.time_left_label, cached[1])
         else:
-            self.time_left_label.setText(tr("player.time_left_unknown"))
+            _set_text_if_changed(self.time_left_label, tr("player.time_left_unknown"))
     
     def _on_subtitles_toggled(self, checked: bool):
         """Show/hide the subtitle panel"""
@@ -1329,15 +1462,14 @@ class PlayerWidget(QWidget):
             self.subtitle_panel.setVisible(False)
         else:
             self.subtitle_panel.setVisible(True)
-            if hasattr(self, '_saved_splitter_state') and self._saved_splitter_state:
+            if self._saved_splitter_state:
                 self.splitter.restoreState(self._saved_splitter_state)
         self.subtitles_toggled_signal.emit(checked)
         
     def on_id3_toggled(self, checked):
         self.show_id3 = checked
-        if hasattr(self, 'last_files_list') and self.last_files_list:
-            current_row = self.file_list.currentRow()
-            self.load_files(self.last_files_list, current_row)
+        if self.last_files_list:
+            self._refresh_file_texts()
         self.id3_toggled_signal.emit(checked)
     
     def on_auto_rewind_toggled(self, checked):
@@ -1352,128 +1484,281 @@ class PlayerWidget(QWidget):
     def on_noise_suppression_toggled(self, checked):
         self.noise_suppression_toggled_signal.emit(checked)
     
+    def _preset_label(self, value: int) -> str:
+        labels = self._preset_labels
+        if labels is None:
+            labels = self._preset_labels = (
+                tr("player.preset_light"),
+                tr("player.preset_medium"),
+                tr("player.preset_strong"),
+            )
+        return labels[value] if 0 <= value < len(labels) else ""
+
+    def _pitch_text(self, semitones: float) -> str:
+        suffix = self._pitch_suffix
+        if suffix is None:
+            suffix = self._pitch_suffix = tr('player.pitch_label')
+        return f"{semitones:+.1f} {suffix}"
+
+    def _ensure_vad_popup(self) -> QWidget:
+        """Build the VAD (advanced noise suppression) settings popup on first use"""
+        if self.vad_popup is not None:
+            return self.vad_popup
+        self.vad_popup = QWidget(self, Qt.WindowType.Popup)
+        self.vad_popup.setObjectName("vadPopup")
+        vad_layout = QGridLayout(self.vad_popup)
+        vad_layout.setContentsMargins(8, 8, 8, 8)
+        vad_layout.setSpacing(8)
+        
+        # 1. Sensitivity (Threshold)
+        self.vad_sens_label_title = QLabel(tr("player.vad_sens_label"))
+        vad_layout.addWidget(self.vad_sens_label_title, 0, 0)
+        self.vad_slider = QSlider(Qt.Orientation.Horizontal)
+        self.vad_slider.setRange(0, 100)
+        self.vad_slider.setValue(self.vad_threshold)
+        self.vad_slider.setFixedWidth(120)
+        self.vad_slider.setToolTip(tr("player.tooltip_vad_threshold"))
+        self.vad_slider.valueChanged.connect(self.on_vad_threshold_changed)
+        self.vad_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        vad_layout.addWidget(self.vad_slider, 0, 1)
+        self.vad_label = QLabel(f"{self.vad_threshold}%")
+        self.vad_label.setFixedWidth(35)
+        vad_layout.addWidget(self.vad_label, 0, 2)
+        
+        # 2. Grace Period
+        self.vad_grace_label_title = QLabel(tr("player.vad_grace_label"))
+        vad_layout.addWidget(self.vad_grace_label_title, 1, 0)
+        self.vad_grace_slider = QSlider(Qt.Orientation.Horizontal)
+        self.vad_grace_slider.setRange(0, 100) # 0-100% (arbitrary scale)
+        self.vad_grace_slider.setValue(self.vad_grace)
+        self.vad_grace_slider.setFixedWidth(120)
+        self.vad_grace_slider.setToolTip(tr("player.tooltip_vad_grace"))
+        self.vad_grace_slider.valueChanged.connect(self.on_vad_grace_changed)
+        self.vad_grace_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        vad_layout.addWidget(self.vad_grace_slider, 1, 1)
+        self.vad_grace_label = QLabel(f"{self.vad_grace}%")
+        self.vad_grace_label.setFixedWidth(35)
+        vad_layout.addWidget(self.vad_grace_label, 1, 2)
+        
+        # 3. Retroactive Grace
+        self.vad_retro_label_title = QLabel(tr("player.vad_retro_label"))
+        vad_layout.addWidget(self.vad_retro_label_title, 2, 0)
+        self.vad_retro_slider = QSlider(Qt.Orientation.Horizontal)
+        self.vad_retro_slider.setRange(0, 100)
+        self.vad_retro_slider.setValue(int(self.vad_retro))
+        self.vad_retro_slider.setFixedWidth(120)
+        self.vad_retro_slider.setToolTip(tr("player.tooltip_vad_retro"))
+        self.vad_retro_slider.valueChanged.connect(self.on_vad_retro_changed)
+        self.vad_retro_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        vad_layout.addWidget(self.vad_retro_slider, 2, 1)
+        self.vad_retro_label = QLabel(f"{self.vad_retro}%")
+        self.vad_retro_label.setFixedWidth(35)
+        vad_layout.addWidget(self.vad_retro_label, 2, 2)
+        return self.vad_popup
+
     def show_vad_slider_popup(self, pos):
         """Show VAD threshold slider popup on right-click"""
+        popup = self._ensure_vad_popup()
         global_pos = self.noise_suppression_btn.mapToGlobal(QPoint(0, self.noise_suppression_btn.height()))
-        self.vad_popup.move(global_pos)
-        self.vad_popup.show()
+        popup.move(global_pos)
+        popup.show()
+    
+    def _queue_slider_value(self, signal_name: str, value):
+        """Forward a slider value, coalescing bursts to one emit per interval"""
+        self._pending_slider_values[signal_name] = value
+        if not self._slider_emit_timer.isActive():
+            self._slider_emit_timer.start()
+    
+    def _emit_pending_slider_values(self):
+        self._slider_emit_timer.stop()
+        pending = self._pending_slider_values
+        self._pending_slider_values = {}
+        for signal_name, value in pending.items():
+            getattr(self, signal_name).emit(value)
     
     def on_vad_threshold_changed(self, value):
         """Handle VAD threshold slider change"""
+        self.vad_threshold = value
         self.vad_label.setText(f"{value}%")
-        self.vad_threshold_changed_signal.emit(value)
+        self._queue_slider_value('vad_threshold_changed_signal', value)
     
     def set_vad_threshold_value(self, value: int):
         """Set VAD slider value programmatically (from settings)"""
-        self.vad_slider.blockSignals(True)
-        self.vad_slider.setValue(value)
-        self.vad_label.setText(f"{value}%")
-        self.vad_slider.blockSignals(False)
+        self.vad_threshold = value
+        if self.vad_popup is None:
+            return
+        with QSignalBlocker(self.vad_slider):
+            self.vad_slider.setValue(value)
+            self.vad_label.setText(f"{value}%")
 
     def on_vad_grace_changed(self, value: int):
         """Handle VAD Grace Period slider change"""
+        self.vad_grace = value
         self.vad_grace_label.setText(f"{value}%")
-        self.vad_grace_period_changed_signal.emit(value)
+        self._queue_slider_value('vad_grace_period_changed_signal', value)
 
     def set_vad_grace_value(self, value: int):
         """Set VAD Grace Period slider value programmatically"""
-        self.vad_grace_slider.blockSignals(True)
-        self.vad_grace_slider.setValue(value)
-        self.vad_grace_label.setText(f"{value}%")
-        self.vad_grace_slider.blockSignals(False)
+        self.vad_grace = value
+        if self.vad_popup is None:
+            return
+        with QSignalBlocker(self.vad_grace_slider):
+            self.vad_grace_slider.setValue(value)
+            self.vad_grace_label.setText(f"{value}%")
 
     def on_vad_retro_changed(self, value: int):
         """Handle Retroactive VAD Grace slider change"""
+        self.vad_retro = value
         self.vad_retro_label.setText(f"{value}%")
-        self.vad_retroactive_grace_changed_signal.emit(value)
+        self._queue_slider_value('vad_retroactive_grace_changed_signal', value)
 
     def set_vad_retro_value(self, value: int):
         """Programmatically update VAD retroactive grace slider"""
-        self.vad_retro_slider.blockSignals(True)
-        self.vad_retro_slider.setValue(int(value))
-        self.vad_retro_label.setText(f"{value}%")
-        self.vad_retro_slider.blockSignals(False)
+        self.vad_retro = value
+        if self.vad_popup is None:
+            return
+        with QSignalBlocker(self.vad_retro_slider):
+            self.vad_retro_slider.setValue(int(value))
+            self.vad_retro_label.setText(f"{value}%")
+
+    def _ensure_deesser_popup(self) -> QWidget:
+        """Build the DeEsser preset popup on first use"""
+        if self.deesser_popup is not None:
+            return self.deesser_popup
+        self.deesser_popup = QWidget(self, Qt.WindowType.Popup)
+        self.deesser_popup.setObjectName("deesserPopup")
+        deesser_layout = QHBoxLayout(self.deesser_popup)
+        deesser_layout.setContentsMargins(8, 4, 8, 4)
+        
+        self.deesser_slider = QSlider(Qt.Orientation.Horizontal)
+        self.deesser_slider.setRange(0, 2) # 0=Light, 1=Medium, 2=Strong
+        self.deesser_slider.setValue(self.deesser_preset)
+        self.deesser_slider.setFixedWidth(80)
+        self.deesser_slider.valueChanged.connect(self.on_deesser_preset_changed)
+        self.deesser_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        deesser_layout.addWidget(self.deesser_slider)
+        
+        self.deesser_desc_label = QLabel(self._preset_label(self.deesser_preset))
+        self.deesser_desc_label.setFixedWidth(60)
+        self.deesser_desc_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        deesser_layout.addWidget(self.deesser_desc_label)
+        return self.deesser_popup
 
     def show_deesser_popup(self, pos):
         """Show DeEsser preset popup below the button"""
+        popup = self._ensure_deesser_popup()
         global_pos = self.deesser_btn.mapToGlobal(QPoint(0, self.deesser_btn.height()))
-        self.deesser_popup.move(global_pos)
-        self.deesser_popup.show()
+        popup.move(global_pos)
+        popup.show()
 
     def on_deesser_preset_changed(self, value: int):
         """Handle changes to DeEsser preset slider"""
-        # Update label text
-        labels = {
-            0: tr("player.preset_light"),
-            1: tr("player.preset_medium"),
-            2: tr("player.preset_strong")
-        }
-        self.deesser_desc_label.setText(labels.get(value, ""))
-        self.deesser_preset_changed_signal.emit(value)
+        self.deesser_preset = value
+        self.deesser_desc_label.setText(self._preset_label(value))
+        self._queue_slider_value('deesser_preset_changed_signal', value)
 
     def set_deesser_preset_value(self, value: int):
         """Programmatically set DeEsser preset"""
-        self.deesser_slider.blockSignals(True)
-        self.deesser_slider.setValue(value)
-        # Also update label
-        labels = {
-            0: tr("player.preset_light"),
-            1: tr("player.preset_medium"),
-            2: tr("player.preset_strong")
-        }
-        self.deesser_desc_label.setText(labels.get(value, ""))
-        self.deesser_slider.blockSignals(False)
+        self.deesser_preset = value
+        if self.deesser_popup is None:
+            return
+        with QSignalBlocker(self.deesser_slider):
+            self.deesser_slider.setValue(value)
+            self.deesser_desc_label.setText(self._preset_label(value))
+
+    def _ensure_compressor_popup(self) -> QWidget:
+        """Build the Compressor preset popup on first use"""
+        if self.compressor_popup is not None:
+            return self.compressor_popup
+        self.compressor_popup = QWidget(self, Qt.WindowType.Popup)
+        self.compressor_popup.setObjectName("compressorPopup")
+        comp_layout = QHBoxLayout(self.compressor_popup)
+        comp_layout.setContentsMargins(8, 4, 8, 4)
+        
+        self.comp_slider = QSlider(Qt.Orientation.Horizontal)
+        self.comp_slider.setRange(0, 2) # 0=Light, 1=Medium, 2=Strong
+        self.comp_slider.setValue(self.compressor_preset)
+        self.comp_slider.setFixedWidth(80)
+        self.comp_slider.valueChanged.connect(self.on_compressor_preset_changed)
+        self.comp_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        comp_layout.addWidget(self.comp_slider)
+        
+        self.comp_desc_label = QLabel(self._preset_label(self.compressor_preset))
+        self.comp_desc_label.setFixedWidth(60)
+        self.comp_desc_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        comp_layout.addWidget(self.comp_desc_label)
+        return self.compressor_popup
 
     def show_compressor_popup(self, pos):
         """Show Compressor preset popup below the button"""
+        popup = self._ensure_compressor_popup()
         global_pos = self.compressor_btn.mapToGlobal(QPoint(0, self.compressor_btn.height()))
-        self.compressor_popup.move(global_pos)
-        self.compressor_popup.show()
+        popup.move(global_pos)
+        popup.show()
 
     def on_compressor_preset_changed(self, value: int):
         """Handle changes to Compressor preset slider"""
-        labels = {
-            0: tr("player.preset_light"),
-            1: tr("player.preset_medium"),
-            2: tr("player.preset_strong")
-        }
-        self.comp_desc_label.setText(labels.get(value, ""))
-        self.compressor_preset_changed_signal.emit(value)
+        self.compressor_preset = value
+        self.comp_desc_label.setText(self._preset_label(value))
+        self._queue_slider_value('compressor_preset_changed_signal', value)
 
     def set_compressor_preset_value(self, value: int):
         """Programmatically set Compressor preset"""
-        self.comp_slider.blockSignals(True)
-        self.comp_slider.setValue(value)
-        # Also update label
-        labels = {
-            0: tr("player.preset_light"),
-            1: tr("player.preset_medium"),
-            2: tr("player.preset_strong")
-        }
-        self.comp_desc_label.setText(labels.get(value, ""))
-        self.comp_slider.blockSignals(False)
+        self.compressor_preset = value
+        if self.compressor_popup is None:
+            return
+        with QSignalBlocker(self.comp_slider):
+            self.comp_slider.setValue(value)
+            self.comp_desc_label.setText(self._preset_label(value))
 
     def on_pitch_toggled(self, checked):
         self.pitch_toggled_signal.emit(checked)
 
+    def _ensure_pitch_popup(self) -> QWidget:
+        """Build the Pitch settings popup on first use"""
+        if self.pitch_popup is not None:
+            return self.pitch_popup
+        self.pitch_popup = QWidget(self, Qt.WindowType.Popup)
+        self.pitch_popup.setObjectName("pitchPopup")
+        pitch_layout = QHBoxLayout(self.pitch_popup)
+        pitch_layout.setContentsMargins(8, 4, 8, 4)
+        
+        self.pitch_slider = QSlider(Qt.Orientation.Horizontal)
+        self.pitch_slider.setRange(-120, 120) # -12.0 to +12.0 semitones
+        self.pitch_slider.setValue(int(self.pitch_semitones * 10))
+        self.pitch_slider.setFixedWidth(120)
+        self.pitch_slider.valueChanged.connect(self.on_pitch_slider_changed)
+        self.pitch_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        pitch_layout.addWidget(self.pitch_slider)
+        
+        self.pitch_val_label = QLabel(self._pitch_text(self.pitch_semitones))
+        self.pitch_val_label.setFixedWidth(60)
+        self.pitch_val_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        pitch_layout.addWidget(self.pitch_val_label)
+        return self.pitch_popup
+
     def show_pitch_popup(self, pos):
         """Show Pitch settings popup below the button"""
+        popup = self._ensure_pitch_popup()
         global_pos = self.pitch_btn.mapToGlobal(QPoint(0, self.pitch_btn.height()))
-        self.pitch_popup.move(global_pos)
-        self.pitch_popup.show()
+        popup.move(global_pos)
+        popup.show()
 
     def on_pitch_slider_changed(self, value: int):
         """Handle pitch slider change (value is x10 semitones)"""
         semitones = value / 10.0
-        self.pitch_val_label.setText(f"{semitones:+.1f} {tr('player.pitch_label')}")
-        self.pitch_changed_signal.emit(semitones)
+        self.pitch_semitones = semitones
+        self.pitch_val_label.setText(self._pitch_text(semitones))
+        self._queue_slider_value('pitch_changed_signal', semitones)
 
     def set_pitch_value(self, semitones: float):
         """Programmatically set pitch value"""
-        self.pitch_slider.blockSignals(True)
-        self.pitch_slider.setValue(int(semitones * 10))
-        self.pitch_val_label.setText(f"{semitones:+.1f} {tr('player.pitch_label')}")
-        self.pitch_slider.blockSignals(False)
+        self.pitch_semitones = semitones
+        if self.pitch_popup is None:
+            return
+        with QSignalBlocker(self.pitch_slider):
+            self.pitch_slider.setValue(int(semitones * 10))
+            self.pitch_val_label.setText(self._pitch_text(semitones))
 
     def on_mono_toggled(self, checked):
         self.mono_toggled_signal.emit(checked)
@@ -1481,132 +1766,211 @@ class PlayerWidget(QWidget):
     def on_volume_boost_toggled(self, checked):
         self.volume_boost_toggled_signal.emit(checked)
 
+    def _ensure_volume_boost_popup(self) -> QWidget:
+        """Build the Volume Boost level popup on first use"""
+        if self.volume_boost_popup is not None:
+            return self.volume_boost_popup
+        value = int(self.volume_boost_level * 100)
+        self.volume_boost_popup = QWidget(self, Qt.WindowType.Popup)
+        self.volume_boost_popup.setObjectName("volumeBoostPopup")
+        vb_layout = QHBoxLayout(self.volume_boost_popup)
+        vb_layout.setContentsMargins(8, 4, 8, 4)
+        
+        self.volume_boost_slider = QSlider(Qt.Orientation.Horizontal)
+        self.volume_boost_slider.setRange(200, 400)  # 200% to 400%
+        self.volume_boost_slider.setValue(value)
+        self.volume_boost_slider.setSingleStep(100)
+        self.volume_boost_slider.setPageStep(100)
+        self.volume_boost_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        self.volume_boost_slider.setTickInterval(100)
+        self.volume_boost_slider.setFixedWidth(120)
+        self.volume_boost_slider.valueChanged.connect(self.on_volume_boost_level_changed)
+        self.volume_boost_slider.sliderReleased.connect(self._emit_pending_slider_values)
+        vb_layout.addWidget(self.volume_boost_slider)
+        
+        self.volume_boost_label = QLabel(f"{value}%")
+        self.volume_boost_label.setFixedWidth(50)
+        self.volume_boost_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        vb_layout.addWidget(self.volume_boost_label)
+        return self.volume_boost_popup
+
     def show_volume_boost_popup(self, pos):
         """Show Volume Boost level popup below the button"""
+        popup = self._ensure_volume_boost_popup()
         global_pos = self.volume_boost_btn.mapToGlobal(QPoint(0, self.volume_boost_btn.height()))
-        self.volume_boost_popup.move(global_pos)
-        self.volume_boost_popup.show()
+        popup.move(global_pos)
+        popup.show()
 
     def on_volume_boost_level_changed(self, value: int):
         """Handle volume boost level slider change (200-400)"""
         snapped = round(value / 100) * 100
         if snapped != value:
-            self.volume_boost_slider.blockSignals(True)
-            self.volume_boost_slider.setValue(snapped)
-            self.volume_boost_slider.blockSignals(False)
+            with QSignalBlocker(self.volume_boost_slider):
+                self.volume_boost_slider.setValue(snapped)
             value = snapped
         self.volume_boost_level = value / 100.0
         self.volume_boost_label.setText(f"{value}%")
-        self.volume_boost_level_changed_signal.emit(self.volume_boost_level)
+        self._queue_slider_value('volume_boost_level_changed_signal', self.volume_boost_level)
 
     def set_volume_boost_level_value(self, level: float):
         """Programmatically set volume boost level (2.0-4.0)"""
-        self.volume_boost_slider.blockSignals(True)
-        value = int(level * 100)
-        self.volume_boost_slider.setValue(value)
-        self.volume_boost_label.setText(f"{value}%")
-        self.volume_boost_slider.blockSignals(False)
+        self.volume_boost_level = level
+        if self.volume_boost_popup is None:
+            return
+        with QSignalBlocker(self.volume_boost_slider):
+            value = int(level * 100)
+            self.volume_boost_slider.setValue(value)
+            self.volume_boost_label.setText(f"{value}%")
 
     
     def set_noise_suppression_active(self, active: bool):
         """Visual indicator when noise suppression is processing"""
+        # Re-polishing re-resolves the button's stylesheet; skip repeated states
+        if active == self._noise_suppression_active:
+            return
+        self._noise_suppression_active = active
         self.noise_suppression_btn.setProperty("processing", active)
         self.noise_suppression_btn.style().unpolish(self.noise_suppression_btn)
         self.noise_suppression_btn.style().polish(self.noise_suppression_btn)
     
     def load_files(self, files_list: list, current_index: int = 0):
         self.last_files_list = files_list
-        self.file_list.clear()
         
-        for i, file_info in enumerate(files_list):
-            duration = file_info.get('duration', 0)
-            if duration >= 3600:
-                dur_str = format_time(duration)
-            else:
-                dur_str = format_time_short(duration)
-            display_name = file_info['name']
+        # Populate with repaints and item signals suspended so a long book
+        # triggers one layout pass instead of one per inserted row
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        try:
+            file_list = self.file_list
+            count = file_list.count()
+            new_count = len(files_list)
             
-            if self.show_id3 and file_info.get('tag_title'):
-                display_name = file_info['tag_title']
+            # Reuse the rows already in the list instead of freeing and
+            # reallocating them on every book switch; only the playing row
+            # carries extra state that must be reset
+            prev_index = self._highlighted_index
+            self._highlighted_index = None
+            if prev_index is not None and prev_index < min(count, new_count):
+                item = file_list.item(prev_index)
+                item.setData(_ORIGINAL_TEXT_ROLE, None)
+                item.setFont(self._font_regular)
+            if new_count == 0:
+                file_list.clear()
+            else:
+                file_list.setCurrentRow(-1)
+                for row in range(count - 1, new_count - 1, -1):
+                    file_list.takeItem(row)
             
-            list_item = QListWidgetItem(
-                trf("formats.file_number", 
-                    number=i+1, 
-                    name=display_name, 
-                    duration=dur_str)
-            )
-            list_item.setData(Qt.ItemDataRole.UserRole, file_info['path'])
-            self.file_list.addItem(list_item)
-        
+            # Loop-invariant lookups bound once
+            show_id3 = self.show_id3
+            row_text = self._file_row_text
+            item_at = file_list.item
+            add_item = file_list.addItem
+            for i, file_info in enumerate(files_list, 1):
+                text = row_text(i, file_info, show_id3)
+                if i <= count:
+                    list_item = item_at(i - 1)
+                    list_item.setText(text)
+                    list_item.setData(_PATH_ROLE, file_info['path'])
+                else:
+                    list_item = QListWidgetItem(text)
+                    list_item.setData(_PATH_ROLE, file_info['path'])
+                    add_item(list_item)
+            file_list.scrollToTop()
+        finally:
+            self.file_list.blockSignals(False)
+            self.file_list.setUpdatesEnabled(True)
+        
+        # Current row is set once, after all rows are in
         if 0 <= current_index < len(files_list):
             self.file_list.setCurrentRow(current_index)
             self.highlight_current_file(current_index)
     
+    def _file_row_text(self, number: int, file_info: dict, show_id3: bool) -> str:
+        """Label for one file_list row; entries from load_audiobook always carry 'duration' and 'tag_title'"""
+        duration = file_info['duration']
+        dur_str = (format_time if duration >= 3600 else format_time_short)(duration)
+        display_name = (show_id3 and file_info['tag_title']) or file_info['name']
+        return self._fmt("formats.file_number", number=number, name=display_name, duration=dur_str)
+    
+    def _refresh_file_texts(self):
+        """Rewrite row labels in place (e.g. after the ID3 toggle) without rebuilding the list"""
+        files_list = self.last_files_list
+        show_id3 = self.show_id3
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            for i in range(min(self.file_list.count(), len(files_list))):
+                item = self.file_list.item(i)
+                text = self._file_row_text(i + 1, files_list[i], show_id3)
+                if item.data(_ORIGINAL_TEXT_ROLE):
+                    # Playing row: keep the indicator, update the saved plain text
+                    item.setData(_ORIGINAL_TEXT_ROLE, text)
+                    text = self._fmt("formats.playing_indicator", text=text)
+                item.setText(text)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+    
     def highlight_current_file(self, index: int):
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            original_text = item.data(Qt.ItemDataRole.UserRole + 1)
-            if not original_text and i == index:
-                original_text = item.text()
-                item.setData(Qt.ItemDataRole.UserRole + 1, original_text)
-            
-            if i == index:
-                item.setText(trf("formats.playing_indicator", text=original_text))
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-            else:
+        """Mark the playing row; only the previous and new rows are touched"""
+        prev_index = self._highlighted_index
+        if prev_index == index:
+            # Steady state (e.g. repeated calls for the same track): nothing to redo
+            item = self.file_list.item(index)
+            if item is not None and item.data(_ORIGINAL_TEXT_ROLE):
+                return
+        if prev_index is not None and prev_index != index:
+            item = self.file_list.item(prev_index)
+            if item is not None:
+                original_text = item.data(_ORIGINAL_TEXT_ROLE)
                 if original_text:
                     item.setText(original_text)
-                    item.setData(Qt.ItemDataRole.UserRole + 1, None)
+                    item.setData(_ORIGINAL_TEXT_ROLE, None)
                 
-                font = item.font()
-                font.setBold(False)
-                item.setFont(font)
+                item.setFont(self._font_regular)
+        
+        item = self.file_list.item(index) if index >= 0 else None
+        if item is None:
+            self._highlighted_index = None
+            return
+        
+        original_text = item.data(_ORIGINAL_TEXT_ROLE)
+        if not original_text:
+            original_text = item.text()
+            item.setData(_ORIGINAL_TEXT_ROLE, original_text)
+        
+        item.setText(self._fmt("formats.playing_indicator", text=original_text))
+        item.setFont(self._font_bold)
+        self._highlighted_index = index
     
     def set_speed(self, value: int):
-        self.speed_slider.setValue(value)
-        self.speed_label.setText(trf("formats.speed", value=value/10))
+        """Reflect a programmatic speed change without re-emitting speed_changed"""
+        with QSignalBlocker(self.speed_slider):
+            self.speed_slider.setValue(value)
+        self.speed_label.setText(self._fmt("formats.speed", value=value/10))
     
     def set_volume(self, value: int):
-        self.volume_slider.setValue(value)
-        self.volume_label.setText(trf("formats.percent", value=value))
+        """Reflect a programmatic volume change without re-emitting volume_changed"""
+        with QSignalBlocker(self.volume_slider):
+            self.volume_slider.setValue(value)
+        self.volume_label.setText(self._fmt("formats.percent", value=value))
     
     def update_texts(self):
         """Update UI texts when language changes"""
-        # Buttons
-        self.id3_btn.setText(tr("player.btn_id3"))
-        self.id3_btn.setToolTip(tr("player.show_id3"))
+        self._templates.clear()
+        self._tick_texts.clear()
+        self._last_total_args = None
+        self._preset_labels = None
+        self._pitch_suffix = None
         
-        if hasattr(self, 'subtitles_btn') and self.subtitles_btn:
-            self.subtitles_btn.setText(tr("player.btn_subtitles"))
-            self.subtitles_btn.setToolTip(tr("player.show_subtitles"))
+        # Buttons
+        for attr, _, label_key, tooltip_key, _, _ in self.LEADING_TOGGLE_BUTTONS + self.EFFECT_TOGGLE_BUTTONS:
+            btn = getattr(self, attr)
+            btn.setText(tr(label_key))
+            btn.setToolTip(tr(tooltip_key))
         
         self.bookmarks_btn.setText(tr("bookmarks.button_label"))
         self.bookmarks_btn.setToolTip(tr("bookmarks.list_title"))
-        if hasattr(self, 'add_bookmark_btn') and self.add_bookmark_btn:
-            self.add_bookmark_btn.setToolTip(tr("bookmarks.add"))
-        
-        self.auto_rewind_btn.setText(tr("player.btn_autorewind"))
-        self.auto_rewind_btn.setToolTip(tr("player.tooltip_auto_rewind"))
-        
-        self.deesser_btn.setText(tr("player.btn_deesser"))
-        self.deesser_btn.setToolTip(tr("player.tooltip_deesser"))
-        
-        self.compressor_btn.setText(tr("player.btn_compressor"))
-        self.compressor_btn.setToolTip(tr("player.tooltip_compressor"))
-        
-        self.noise_suppression_btn.setText(tr("player.btn_noise_suppression"))
-        self.noise_suppression_btn.setToolTip(tr("player.tooltip_noise_suppression"))
-        
-        self.pitch_btn.setText(tr("player.btn_pitch"))
-        self.pitch_btn.setToolTip(tr("player.tooltip_pitch"))
-        
-        self.mono_btn.setText(tr("player.btn_mono"))
-        self.mono_btn.setToolTip(tr("player.tooltip_mono"))
-        
-        self.volume_boost_btn.setText(tr("player.btn_volume_boost"))
-        self.volume_boost_btn.setToolTip(tr("player.tooltip_volume_boost"))
+        self.add_bookmark_btn.setToolTip(tr("bookmarks.add"))
         
         # Sliders
         self.volume_slider.setToolTip(tr("player.volume"))
@@ -1614,8 +1978,8 @@ class PlayerWidget(QWidget):
         
         # Update dynamic labels
         speed_value = self.speed_slider.value() / 10
-        self.speed_label.setText(trf("formats.speed", value=speed_value))
-        self.volume_label.setText(trf("formats.percent", value=self.volume_slider.value()))
+        self.speed_label.setText(self._fmt("formats.speed", value=speed_value))
+        self.volume_label.setText(self._fmt("formats.percent", value=self.volume_slider.value()))
         
         # Control Buttons Tooltips
         self.btn_prev.setToolTip(tr("player.prev_track"))
@@ -1625,37 +1989,24 @@ class PlayerWidget(QWidget):
         self.btn_ff10.setToolTip(tr("player.forward_10"))
         self.btn_ff60.setToolTip(tr("player.forward_60"))
         self.play_btn.setToolTip(tr("player.play"))
+        self._shown_playing = None  # the next set_playing() restores the pause state if needed
         
-        # Popups
-        if hasattr(self, 'deesser_desc_label'):
-             # Re-trigger preset changed to update label text
-             self.on_deesser_preset_changed(self.deesser_preset)
+        # Popups (only the ones already built; the rest pick up the language when created)
+        if self.deesser_popup is not None:
+            self.deesser_desc_label.setText(self._preset_label(self.deesser_preset))
              
-        if hasattr(self, 'comp_desc_label'):
-             self.on_compressor_preset_changed(self.compressor_preset)
+        if self.compressor_popup is not None:
+            self.comp_desc_label.setText(self._preset_label(self.compressor_preset))
              
-        if hasattr(self, 'vad_label'):
-            # Update VAD labels if needed, though they are usually numeric. 
-            # But the static labels "Sensitivity:", etc are in the popup layout.
-            if hasattr(self, 'vad_sens_label_title'):
-                self.vad_sens_label_title.setText(tr("player.vad_sens_label"))
-            if hasattr(self, 'vad_grace_label_title'):
-                self.vad_grace_label_title.setText(tr("player.vad_grace_label"))
-            if hasattr(self, 'vad_retro_label_title'):
-                self.vad_retro_label_title.setText(tr("player.vad_retro_label"))
-            
-            # Update tooltips for VAD sliders
-            if hasattr(self, 'vad_slider'):
-                self.vad_slider.setToolTip(tr("player.tooltip_vad_threshold"))
-            if hasattr(self, 'vad_grace_slider'):
-                self.vad_grace_slider.setToolTip(tr("player.tooltip_vad_grace"))
-            if hasattr(self, 'vad_retro_slider'):
-                self.vad_retro_slider.setToolTip(tr("player.tooltip_vad_retro"))
-        
-        if hasattr(self, 'pitch_val_label'):
-             # Update pitch label unit "st"
-             semitones = self.pitch_slider.value() / 10.0
-             self.pitch_val_label.setText(f"{semitones:+.1f} {tr('player.pitch_label')}")
-
-        if hasattr(self, 'subtitle_panel') and self.subtitle_panel:
-             self.subtitle_panel.update_texts()
+        if self.vad_popup is not None:
+            self.vad_sens_label_title.setText(tr("player.vad_sens_label"))
+            self.vad_grace_label_title.setText(tr("player.vad_grace_label"))
+            self.vad_retro_label_title.setText(tr("player.vad_retro_label"))
+            self.vad_slider.setToolTip(tr("player.tooltip_vad_threshold"))
+            self.vad_grace_slider.setToolTip(tr("player.tooltip_vad_grace"))
+            self.vad_retro_slider.setToolTip(tr("player.tooltip_vad_retro"))
+        
+        if self.pitch_popup is not None:
+            self.pitch_val_label.setText(self._pitch_text(self.pitch_semitones))
+
+        self.subtitle_panel.update_texts()
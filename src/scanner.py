@@ -1,4 +1,5 @@
 import os
+import codecs
 import sqlite3
 import re
 import time
@@ -12,8 +13,8 @@ from concurrent.futures import ThreadPoolExecutor
 
 from database import init_database
 from lang_detector import detect as detect_language
-from PyQt6.QtGui import QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImageReader
+from PyQt6.QtCore import Qt, QBuffer, QByteArray
 
 # Ensure correct UTF-8 output in Windows console
 if hasattr(sys.stdout, 'reconfigure'):
@@ -22,19 +23,40 @@ if hasattr(sys.stdout, 'reconfigure'):
     except:
         pass
 
+# _fix_encoding: characters a CP1251 string gains when decoded as Latin-1,
+# Cyrillic А-я, and a Latin letter directly next to a Cyrillic one (a word
+# mixing both scripts means a false correction of accented Latin text)
+_LATIN1_HIGH_RE = re.compile(r'[\x80-\xff]')
+_CYRILLIC_RE = re.compile(r'[\u0410-\u044f]')
+_MIXED_SCRIPT_RE = re.compile(r'[A-Za-z][\u0400-\u04ff]|[\u0400-\u04ff][A-Za-z]')
+
+# _parse_audiobook_name: bracket parts that are technical info rather than a
+# narrator, narrator prefixes, trailing studio abbreviations, author/title dash
+_YEAR_PART_RE = re.compile(r'^\d{4}$')
+_TECH_KEYWORD_RE = re.compile(r'kbps|mp3|m4b|flac|ogg|wav|opus|ape|aac', re.IGNORECASE)
+_NARRATOR_PREFIX_RE = re.compile(r'^(чит\.|читает)\s+', re.IGNORECASE)
+_STUDIO_SUFFIX_RE = re.compile(r'\s*\([А-ЯA-Z]{2,5}\)$')
+_AUTHOR_TITLE_SPLIT_RE = re.compile(r'\s*[–—-]\s*')
+
 
 class AudiobookScanner:
     """Library scanner for processing audiobook directories and metadata"""
     
+    _tr_source = None
+    _tr_cache: dict = {}
+    
     def _log(self, message: str, end: str = '\n'):
         """Helper to print formatted messages"""
+        text = message + end
         if getattr(self, '_last_was_progress', False) and not message.startswith('\r'):
             # Clear progress line from both console and GUI
-            print("\r" + " " * 90 + "\r", end="", flush=True)
+            text = "\r" + " " * 90 + "\r" + text
             self._last_was_progress = False
         if message.startswith('\r'):
             self._last_was_progress = True
-        print(message, end=end, flush=True)
+        # A single write per line: during a library scan each write is a signal
+        # to the scan dialog, which re-parses and scrolls its console per call
+        print(text, end="", flush=True)
 
     def _log_header(self, title: str):
         """Print a centered header"""
@@ -142,20 +164,31 @@ class AudiobookScanner:
                 
     def tr(self, key: str, **kwargs) -> str:
         """Translate string by key"""
-        parts = key.split('.')
+        # Resolved templates are kept per key until translations is replaced
+        if self._tr_source is not self.translations:
+            self._tr_source = self.translations
+            self._tr_cache = {}
+        try:
+            data = self._tr_cache[key]
+        except KeyError:
+            data = self._tr_cache[key] = self._resolve_tr(key)
+        if data is None:
+            return key  # Return key if translation not found
+        
+        try:
+            return data.format(**kwargs)
+        except KeyError:
+            return data
+
+    def _resolve_tr(self, key: str):
+        """Walk the translations for a dotted key; None if it is missing or not a string"""
         data = self.translations
-        for p in parts:
+        for p in key.split('.'):
             if isinstance(data, dict) and p in data:
                 data = data[p]
             else:
-                return key  # Return key if translation not found
-        
-        if isinstance(data, str):
-            try:
-                return data.format(**kwargs)
-            except KeyError:
-                return data
-        return key
+                return None
+        return data if isinstance(data, str) else None
 
 
     def _load_settings(self):
@@ -169,7 +202,9 @@ class AudiobookScanner:
             'extensions',
             fallback='.mp3,.m4a,.m4b,.mp4,.ogg,.flac,.wav,.aac,.wma,.opus,.ape'
         )
-        self.audio_extensions = {e.strip().lower() for e in extensions.split(',') if e.strip()}
+        self.audio_extensions = frozenset(e.strip().lower() for e in extensions.split(',') if e.strip())
+        # Same set for str.endswith() on raw file names, without building a Path per name
+        self._audio_endswith = tuple(sorted(e for e in self.audio_extensions if e.startswith('.')))
         
         covers = config.get(
             'Covers',
@@ -230,27 +265,21 @@ class AudiobookScanner:
         """Correct text encoding issues (e.g., CP1251 read as Latin-1)"""
         if not text or not isinstance(text, str):
             return text
+        # Most tags are plain ASCII; isascii() is a single C-level check
+        if text.isascii():
+            return text
             
         try:
             # Check for characters from extended Latin (128-255) often appearing 
             # if CP1251 is incorrectly read as Latin-1
-            if any(128 <= ord(c) <= 255 for c in text):
+            if _LATIN1_HIGH_RE.search(text):
                 # Attempt to re-encode from Latin-1 and decode as CP1251
                 fixed = text.encode('latin-1').decode('cp1251')
-                # If Cyrillic characters appear, correction was likely successful
-                if any(1040 <= ord(c) <= 1103 for c in fixed): # A-я in Unicode
-                    # Ensure no single word contains both Latin and Cyrillic characters,
-                    # which would indicate a false correction on accented Latin characters
-                    words = re.findall(r'[A-Za-z\u0400-\u04FF\u0401\u0451]+', fixed)
-                    has_mixed = False
-                    for w in words:
-                        has_latin = any(('a' <= c <= 'z') or ('A' <= c <= 'Z') for c in w)
-                        has_cyrillic = any('\u0400' <= c <= '\u04FF' or c in '\u0401\u0451' for c in w)
-                        if has_latin and has_cyrillic:
-                            has_mixed = True
-                            break
-                    if not has_mixed:
-                        return fixed
+                # If Cyrillic characters appear, correction was likely successful.
+                # Ensure no single word contains both Latin and Cyrillic characters,
+                # which would indicate a false correction on accented Latin characters
+                if _CYRILLIC_RE.search(fixed) and not _MIXED_SCRIPT_RE.search(fixed):
+                    return fixed
         except (UnicodeEncodeError, UnicodeDecodeError):
             pass
             
@@ -301,17 +330,16 @@ class AudiobookScanner:
             for part in parts:
                 # Check if it's NOT technical info
                 is_technical = (
-                    re.match(r'^\d{4}$', part) or  # Year
-                    any(kw in part.lower() for kw in ['kbps', 'mp3', 'm4b', 'flac', 'ogg', 'wav', 'opus', 'ape', 'aac'])
+                    _YEAR_PART_RE.match(part) or  # Year
+                    _TECH_KEYWORD_RE.search(part)
                 )
                 
                 if not is_technical:
                     # Remove "narrated by" or equivalent prefixes
-                    p_clean = re.sub(r'^(чит\.|читает)\s+', '', part, flags=re.IGNORECASE).strip()
+                    p_clean = _NARRATOR_PREFIX_RE.sub('', part).strip()
                     
                     # Remove studio abbreviations in brackets if present
-                    if re.search(r'\([А-ЯA-Z]{2,5}\)$', p_clean):
-                        p_clean = re.sub(r'\s*\([А-ЯA-Z]{2,5}\)$', '', p_clean).strip()
+                    p_clean = _STUDIO_SUFFIX_RE.sub('', p_clean).strip()
                     
                     if p_clean:
                         cleaned_parts.append(p_clean)
@@ -323,7 +351,7 @@ class AudiobookScanner:
         narrator = ", ".join(narrator_parts)
         
         # Split author and title by dash/hyphen
-        m2 = re.split(r'\s*[–—-]\s*', folder_name_clean, maxsplit=1)
+        m2 = _AUTHOR_TITLE_SPLIT_RE.split(folder_name_clean, maxsplit=1)
         if len(m2) == 2:
             author, title = m2
         else:
@@ -620,7 +648,9 @@ class AudiobookScanner:
                 text=True, 
                 encoding='utf-8', 
                 timeout=10, 
-                startupinfo=startupinfo
+                startupinfo=startupinfo,
+                # No console (and no conhost process) is created for the probe
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
             if result.returncode == 0:
                 data = json.loads(result.stdout)
@@ -641,6 +671,16 @@ class AudiobookScanner:
             
         return chapters
 
+    def _extract_chapters_parallel(self, files, max_workers=4):
+        """Extract chapters for several files at once; returns {path: chapters}"""
+        if not files or not self.has_ffprobe:
+            return {}
+        if len(files) == 1:
+            return {files[0]: self._extract_chapters(files[0])}
+        workers = min(max_workers, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(files, executor.map(self._extract_chapters, files)))
+
     def _parse_cue_file(self, cue_path):
         """Parse a .cue file to extract metadata and chapters"""
         metadata = {'author': '', 'title': '', 'year': '', 'narrator': ''}
@@ -701,11 +741,10 @@ class AudiobookScanner:
                                 pass
             
             # Calculate durations for chapters
-            for i in range(len(chapters)):
-                if i < len(chapters) - 1:
-                    chapters[i]['duration'] = chapters[i+1]['start'] - chapters[i]['start']
-                else:
-                    chapters[i]['duration'] = 0 # To be filled later with file duration if needed
+            for chapter, next_chapter in zip(chapters, chapters[1:]):
+                chapter['duration'] = next_chapter['start'] - chapter['start']
+            if chapters:
+                chapters[-1]['duration'] = 0 # To be filled later with file duration if needed
                     
         except Exception as e:
             print(f"Error parsing .cue file: {e}")
@@ -747,22 +786,32 @@ class AudiobookScanner:
     def _has_audio_files(self, directory):
         """Check if directory contains supported audio files"""
         try:
-            for f in directory.iterdir():
-                if f.is_file() and f.suffix.lower() in self.audio_extensions:
-                    return True
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(self._audio_endswith):
+                        return True
             return False
         except PermissionError:
             return False
 
-    def _find_playlist_files(self, folder: Path) -> list:
-        """Find all .m3u/.m3u8 files in folder (not recursive)"""
-        m3u_files = []
-        for ext in ('*.m3u', '*.m3u8'):
-            try:
-                m3u_files.extend(folder.glob(ext))
-            except Exception:
-                pass
-        return sorted(m3u_files)
+    def _list_folder(self, folder: Path, names=None):
+        """
+        List a folder once (not recursive), or classify file names already listed.
+        Returns: (sorted audio files, sorted .m3u/.m3u8 files, .cue files)
+        """
+        if names is None:
+            with os.scandir(folder) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        audio_files, playlist_files, cue_files = [], [], []
+        for name in names:
+            lower = name.lower()
+            if lower.endswith(self._audio_endswith):
+                audio_files.append(folder / name)
+            elif lower.endswith(('.m3u', '.m3u8')):
+                playlist_files.append(folder / name)
+            elif lower.endswith('.cue'):
+                cue_files.append(folder / name)
+        return sorted(audio_files), sorted(playlist_files), cue_files
 
     def _parse_m3u_file(self, m3u_path: Path) -> list:
         """
@@ -1452,7 +1501,9 @@ class AudiobookScanner:
                 text=True, 
                 encoding='utf-8', 
                 timeout=10, 
-                startupinfo=startupinfo
+                startupinfo=startupinfo,
+                # No console (and no conhost process) is created for the probe
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
             )
             
             if result.returncode == 0:
@@ -1499,16 +1550,15 @@ class AudiobookScanner:
             files_to_analyze = files
             file_indices = list(range(len(files)))
             
-        # 2. Analyze only non-cached files
+        # 2. Analyze only non-cached files. The ffprobe fallback runs inside the
+        # workers too, so process start-up for stragglers overlaps instead of
+        # running one file at a time afterwards
         if files_to_analyze:
             workers = min(max_workers, len(files_to_analyze))
             with ThreadPoolExecutor(max_workers=workers) as executor:
-                fast_results = list(executor.map(lambda f: self._analyze_file_fast(f, verbose), files_to_analyze))
-                
-            for idx, (f, info) in zip(file_indices, zip(files_to_analyze, fast_results)):
-                if info.pop('needs_ffprobe', False):
-                    info = self._analyze_file_with_ffprobe(f, info, verbose)
+                analyzed = list(executor.map(lambda f: self._analyze_file(f, verbose), files_to_analyze))
                 
+            for idx, f, info in zip(file_indices, files_to_analyze, analyzed):
                 # Save to cache
                 if conn and info['duration'] > 0:
                     self._save_to_cache(f, info, conn)
@@ -1517,6 +1567,31 @@ class AudiobookScanner:
             
         return results
 
+    @staticmethod
+    def _read_cover_thumbnail(source):
+        """Decode an image file path or image bytes to a cover scaled to fit 300x300"""
+        if isinstance(source, (bytes, bytearray)):
+            device = QBuffer()
+            device.setData(QByteArray(bytes(source)))
+            reader = QImageReader(device)
+        else:
+            reader = QImageReader(source)
+        size = reader.size()
+        if not size.isValid():
+            image = reader.read()
+            if image.isNull():
+                return image
+            return image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Let the decoder scale while reading: large JPEG covers are decoded
+        # at a fraction of their size instead of in full and scaled afterwards
+        reader.setScaledSize(size.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio))
+        return reader.read()
+
+    def _embedded_cover_path(self, key):
+        """Cache path for a cover extracted from the audio files of `key`"""
+        # Use MD5 hash of the key (path) to ensure stable cover filename
+        return self.covers_dir / f"{hashlib.md5(key.encode()).hexdigest()}.jpg"
+
     def _extract_cover_from_file(self, f, key, force_update=False):
         """Extract embedded cover from a specific file"""
         try:
@@ -1524,9 +1599,7 @@ class AudiobookScanner:
             from mutagen.mp4 import MP4
             from mutagen.flac import FLAC
             
-            # Use MD5 hash of the key (path) to ensure stable cover filename
-            safe_name = hashlib.md5(key.encode()).hexdigest()
-            cover_path = self.covers_dir / f"{safe_name}.jpg"
+            cover_path = self._embedded_cover_path(key)
             
             # Check directly if file exists
             if cover_path.exists() and not force_update:
@@ -1558,9 +1631,8 @@ class AudiobookScanner:
             
             if img_data:
                 # Resize and save
-                image = QImage.fromData(img_data)
-                if not image.isNull():
-                     scaled = image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                scaled = self._read_cover_thumbnail(img_data)
+                if not scaled.isNull():
                      scaled.save(str(cover_path), "JPG")
                      return str(cover_path)
 
@@ -1571,11 +1643,13 @@ class AudiobookScanner:
 
     def _extract_embedded_cover(self, directory, key, force_update=False):
         """Extract embedded cover image from audio files"""
+        # A cover extracted on an earlier scan needs no directory listing
+        if not force_update:
+            cover_path = self._embedded_cover_path(key)
+            if cover_path.exists():
+                return str(cover_path)
         try:
-            audio_files = sorted(
-                f for f in directory.iterdir()
-                if f.is_file() and f.suffix.lower() in self.audio_extensions
-            )
+            audio_files = self._list_folder(directory)[0]
             
             for f in audio_files[:3]:
                 result = self._extract_cover_from_file(f, key, force_update=force_update)
@@ -1596,36 +1670,34 @@ class AudiobookScanner:
              embedded = self._extract_cover_from_file(path_obj, key, force_update=force_update)
              return None, embedded
 
+        # Use MD5 hash of the key (path) to ensure stable cover filename
+        safe_name = hashlib.md5(key.encode()).hexdigest()
+        
         # Helper to cache a file
         def cache_file(src_path):
+            src_path_obj = Path(src_path)
+            dest_path = self.covers_dir / f"{safe_name}{src_path_obj.suffix.lower()}"
             try:
-                src_path_obj = Path(src_path)
                 if not src_path_obj.exists():
                     return None
-                    
-                ext = src_path_obj.suffix.lower()
-                safe_name = hashlib.md5(key.encode()).hexdigest()
-                dest_path = self.covers_dir / f"{safe_name}{ext}"
                 
                 # Check directly if file exists to avoid unnecessary copy
-                if not dest_path.exists() or force_update:
-                    # Try to resize and save
-                    image = QImage(str(src_path))
-                    if not image.isNull():
-                         scaled = image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                         scaled.save(str(dest_path))
-                    else:
-                         # Fallback to direct copy
-                         shutil.copy2(src_path, dest_path)
+                if dest_path.exists() and not force_update:
+                    return str(dest_path)
+                
+                # Try to resize and save
+                scaled = self._read_cover_thumbnail(str(src_path))
+                if not scaled.isNull():
+                     scaled.save(str(dest_path))
+                else:
+                     # Fallback to direct copy
+                     shutil.copy2(src_path, dest_path)
                          
                 return str(dest_path)
             except Exception as e:
                 self._log_error(f"Error caching cover: {e}")
                 try:
                     # Fallback to direct copy on error
-                    ext = Path(src_path).suffix.lower()
-                    safe_name = hashlib.md5(key.encode()).hexdigest()
-                    dest_path = self.covers_dir / f"{safe_name}{ext}"
                     if not dest_path.exists() or force_update:
                         shutil.copy2(src_path, dest_path)
                     return str(dest_path)
@@ -1642,12 +1714,16 @@ class AudiobookScanner:
             except (PermissionError, OSError):
                 continue
         
+        image_exts = ('.jpg', '.jpeg', '.png', '.bmp', '.webp')
+        
         # 2. Search in current directory (any image)
         try:
-            for f in directory.iterdir():
-                if f.is_file() and f.suffix.lower() in {'.jpg', '.jpeg', '.png', '.bmp', '.webp'}:
-                     cached = cache_file(str(f))
-                     return str(f), cached
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(image_exts):
+                        f = directory / entry.name
+                        cached = cache_file(str(f))
+                        return str(f), cached
         except (PermissionError, OSError):
             pass
         
@@ -1661,25 +1737,29 @@ class AudiobookScanner:
             except Exception:
                 pass
         
-        # 3. Recursive search in subdirectories (priority names)
-        for name in self.cover_names:
-            try:
-                for p in directory.rglob(name):
-                    if p.is_file():
-                        cached = cache_file(str(p))
-                        return str(p), cached
-            except (PermissionError, OSError):
-                continue
+        # 3-4. Recursive search in subdirectories: a single walk collects the
+        # candidates, then priority names are tried before any image
+        cover_names = [name.lower() for name in self.cover_names]
+        candidates = []
+        for dirpath, _, filenames in os.walk(directory):
+            for fn in filenames:
+                lower = fn.lower()
+                if lower.endswith(image_exts) or lower in cover_names:
+                    candidates.append((lower, Path(dirpath) / fn))
+        
+        # 3. Priority names
+        for name in cover_names:
+            for lower, p in candidates:
+                if lower == name and p.is_file():
+                    cached = cache_file(str(p))
+                    return str(p), cached
         
-        # 4. Recursive search in subdirectories (any image)
-        for ext in ('.jpg', '.jpeg', '.png', '.bmp', '.webp'):
-            try:
-                for p in directory.rglob(f"*{ext}"):
-                    if p.is_file():
-                        cached = cache_file(str(p))
-                        return str(p), cached
-            except (PermissionError, OSError):
-                continue
+        # 4. Any image
+        for ext in image_exts:
+            for lower, p in candidates:
+                if lower.endswith(ext) and p.is_file():
+                    cached = cache_file(str(p))
+                    return str(p), cached
         
         # 5. Fallback to embedded cover
         # Embedded cover extraction already handles caching/extraction to covers_dir
@@ -1826,9 +1906,8 @@ class AudiobookScanner:
             try:
                 dest_path_obj = Path(dest_path)
                 if force_update or not dest_path_obj.exists():
-                    image = QImage(str(src_path))
-                    if not image.isNull():
-                        scaled = image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                    scaled = self._read_cover_thumbnail(str(src_path))
+                    if not scaled.isNull():
                         scaled.save(str(dest_path))
                     else:
                         shutil.copy2(src_path, dest_path)
@@ -1848,9 +1927,8 @@ class AudiobookScanner:
             try:
                 dest_path_obj = Path(dest_path)
                 if force_update or not dest_path_obj.exists():
-                    image = QImage.fromData(img_data)
-                    if not image.isNull():
-                        scaled = image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                    scaled = self._read_cover_thumbnail(img_data)
+                    if not scaled.isNull():
                         scaled.save(str(dest_path), "JPG")
                         return True
                 else:
@@ -2139,27 +2217,28 @@ class AudiobookScanner:
             
         return None
 
-    def _find_all_root_cover_files(self, directory):
+    def _find_all_root_cover_files(self, directory, names=None):
         """Find all cover image files in the root directory only (no rglob)
         
         Args:
             directory: Path to the audiobook directory
+            names: File names of the directory if already listed
             
         Returns:
             List of string paths to cover files
         """
         path_obj = Path(directory)
-        if path_obj.is_file():
-            return []
-            
-        covers = []
-        try:
-            for f in path_obj.iterdir():
-                if f.is_file() and f.suffix.lower() in {'.jpg', '.jpeg', '.png', '.bmp', '.webp'}:
-                    covers.append(str(f))
-        except (PermissionError, OSError):
-            pass
-        return sorted(covers)
+        if names is None:
+            if path_obj.is_file():
+                return []
+            try:
+                names = [f.name for f in path_obj.iterdir() if f.is_file()]
+            except (PermissionError, OSError):
+                return []
+        return sorted(
+            str(path_obj / name) for name in names
+            if name.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.webp'))
+        )
 
     def _find_cover_file(self, directory):
         """Find original cover image file (without caching)
@@ -2219,7 +2298,7 @@ class AudiobookScanner:
         
         return None
 
-    def _find_description_file(self, directory):
+    def _find_description_file(self, directory, names=None):
         """Find description text file
         
         Searches for text files in the following priority:
@@ -2231,17 +2310,20 @@ class AudiobookScanner:
         
         Args:
             directory: Path to the audiobook directory
+            names: File names of the directory if already listed
         
         Returns:
             String path to description file, or None if not found
         """
         path_obj = Path(directory)
         
+        if names is not None:
+            potential_desc_files = sorted(path_obj / name for name in names if name.lower().endswith('.txt'))
         # Standalone file - no description
-        if path_obj.is_file():
+        elif path_obj.is_file():
             return None
-        
-        potential_desc_files = sorted([f for f in directory.glob("*.txt")])
+        else:
+            potential_desc_files = sorted([f for f in directory.glob("*.txt")])
         if not potential_desc_files:
             return None
         
@@ -2266,10 +2348,21 @@ class AudiobookScanner:
         # Greedy UTF-16LE is placed after 8-bit encodings to avoid false positives.
         encodings = ['utf-8-sig', 'utf-8', 'utf-16', 'cp1251', 'cp1252', 'utf-16-le', 'latin-1']
         
+        try:
+            # Read once; each candidate encoding is tried on the bytes in memory
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception:
+            return ""
+        
         for enc in encodings:
             try:
-                with open(file_path, 'r', encoding=enc, errors='strict') as f:
-                    content = f.read().strip()
+                # The incremental decoder is what text-mode open() uses, so e.g.
+                # 'utf-16' still requires a BOM; newlines are translated the same way
+                content = codecs.getincrementaldecoder(enc)(errors='strict').decode(data, final=True)
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                content = content.strip()
                 
                 if content:
                     # Heuristic to detect UTF-16 interpretation of 8-bit text:
@@ -2284,15 +2377,10 @@ class AudiobookScanner:
                     return content
             except (UnicodeDecodeError, UnicodeError):
                 continue
-            except Exception:
-                break
                 
         # Last resort fallback with replacement characters
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                return f.read().strip()
-        except Exception:
-            return ""
+        content = data.decode('utf-8', errors='replace')
+        return content.replace('\r\n', '\n').replace('\r', '\n').strip()
 
     def _log_book_summary(self, title, author, narrator, duration, file_count, codec, bitrate, bitrate_mode, cover, cue_count, problems, language=None, year_written=None, year_recorded=None):
         """Print a consolidated summary of the book"""
@@ -2375,6 +2463,7 @@ class AudiobookScanner:
             c.execute("PRAGMA synchronous = NORMAL")
             c.execute("PRAGMA journal_mode = WAL")
             c.execute("PRAGMA cache_size = 10000")
+            c.execute("PRAGMA temp_store = MEMORY")
             
             # One-time migration/backfill of content hashes for existing books that are still at their current paths
             try:
@@ -2490,6 +2579,10 @@ class AudiobookScanner:
             self._log_section(self.tr("scanner.searching_books"))
             
             folders = []
+            # File names per found folder, reused instead of listing it again
+            folder_names = {}
+            # str.startswith() tests all merged-folder prefixes in one call
+            merged_prefixes = tuple(mp + os.sep for mp in merged_paths_set)
             walk_target = subfolder if subfolder else root
             for dirpath, dirnames, filenames in os.walk(walk_target):
                 d = Path(dirpath)
@@ -2500,22 +2593,17 @@ class AudiobookScanner:
                 if rel_path_str == '.': continue
                 
                 # Check for merged parent
-                is_child_of_merged = False
-                for mp in merged_paths_set:
-                    if rel_path_str.startswith(mp + os.sep):
-                        is_child_of_merged = True
-                        break
-                
-                if is_child_of_merged:
+                if rel_path_str.startswith(merged_prefixes):
                     dirnames.clear() # Skip subdirectories
                     continue
                 
                 # Check for audio files or playlist files in current filenames list (fast)
-                has_audio = any(Path(fn).suffix.lower() in self.audio_extensions for fn in filenames)
-                has_playlist = any(Path(fn).suffix.lower() in ('.m3u', '.m3u8') for fn in filenames)
+                has_audio = any(fn.lower().endswith(self._audio_endswith) for fn in filenames)
+                has_playlist = any(fn.lower().endswith(('.m3u', '.m3u8')) for fn in filenames)
                 
                 if has_audio or has_playlist or (rel_path_str in merged_paths_set):
                     folders.append(d)
+                    folder_names[d] = filenames
             
             self._log_info(self.tr("scanner.found_folders", count=len(folders)))
             
@@ -2525,14 +2613,12 @@ class AudiobookScanner:
             if not subfolder:
                 try:
                     for f in root.iterdir():
-                        if f.is_file() and f.suffix.lower() in self.audio_extensions:
+                        if not f.is_file():
+                            continue
+                        ext = f.suffix.lower()
+                        if ext in self.audio_extensions:
                             standalone_files.append(f)
-                except PermissionError:
-                    pass
-
-                try:
-                    for f in root.iterdir():
-                        if f.is_file() and f.suffix.lower() in ('.m3u', '.m3u8'):
+                        elif ext in ('.m3u', '.m3u8'):
                             standalone_m3u.append(f)
                 except PermissionError:
                     pass
@@ -2594,7 +2680,8 @@ class AudiobookScanner:
                 progress_text = self.tr("scanner.processing_item", current=idx, total=total_items, name=folder.name)
                 self._log(f"\r{percent}% | {progress_text}", end="")
                 
-                m3u_files = self._find_playlist_files(folder)
+                names = folder_names.get(folder)
+                folder_audio, m3u_files, cue_files = self._list_folder(folder, names)
                 if m3u_files:
                     self._process_playlist_in_folder(folder, root, m3u_files, conn, save_folder, verbose, force_rescan=force_rescan)
                     continue
@@ -2613,10 +2700,7 @@ class AudiobookScanner:
                     )
                 else:
                     # Standard flat scan
-                    files = sorted(
-                        f for f in folder.iterdir()
-                        if f.is_file() and f.suffix.lower() in self.audio_extensions
-                    )
+                    files = folder_audio
                 
                 # Query database for existing record
                 c.execute("SELECT id, state_hash, codec, total_size, cover_path, content_hash FROM audiobooks WHERE path = ?", (str(rel),))
@@ -2662,12 +2746,12 @@ class AudiobookScanner:
                         pass
                 
                 # Also include all root covers to detect new covers added to root
-                root_covers = self._find_all_root_cover_files(folder)
+                root_covers = self._find_all_root_cover_files(folder, names)
                 for rc in root_covers:
                     if rc not in cover_files:
                         cover_files.append(rc)
                 
-                description_file_path = self._find_description_file(folder)
+                description_file_path = self._find_description_file(folder, names)
                 
                 # Verbose logging (using primary cover file if found)
                 if verbose:
@@ -2821,8 +2905,7 @@ class AudiobookScanner:
                 # Search for cover image
                 cover, cover_cached = self._find_cover(folder, str(rel), parent_cover_file, force_update=is_rescan)
 
-                # Check for .cue files in this folder
-                cue_files = list(folder.glob('*.cue'))
+                # .cue files in this folder (listed above)
                 cue_data_chapters = []
                 if cue_files:
                     _, cue_data_chapters = self._parse_cue_file(cue_files[0])
@@ -3054,15 +3137,18 @@ class AudiobookScanner:
                 virtual_file_index = 1
                 files_batch = []
                 
+                # Embedded chapters of all MP4-family files, probed concurrently
+                chapters_by_file = self._extract_chapters_parallel(
+                    [f for f in files if f.suffix.lower() in ('.m4b', '.mp4', '.m4a')]
+                )
+                
                 for i, (f, info) in enumerate(zip(files, file_analyses), 1):
                     f_tags = self._extract_file_tags(f)
                     file_duration = info['duration']
                     srt_path = self._find_srt_for_file(f, root)
                     
                     # Check for chapters
-                    chapters = []
-                    if f.suffix.lower() in ('.m4b', '.mp4', '.m4a'):
-                        chapters = self._extract_chapters(f)
+                    chapters = chapters_by_file.get(f, [])
                     
                     if not chapters and cue_data_chapters and len(files) == 1:
                         chapters = cue_data_chapters
@@ -14,6 +14,8 @@ class TranslationManager:
     _translations: Dict[str, Dict[str, str]] = {}
     _language_names: Dict[str, str] = {}
     _current_language = Language.RUSSIAN
+    # Resolved strings for the current language, keyed by (key, default)
+    _cache: Dict[Tuple[str, Optional[str]], str] = {}
     
     def __new__(cls):
         """Create or return the singleton instance"""
@@ -34,6 +36,7 @@ class TranslationManager:
         """Load all available translation files form the directory"""
         self._translations = {}
         self._language_names = {}
+        self._cache = {}
         
         # Ensure directory exists
         if not self.translations_dir.exists():
@@ -70,6 +73,7 @@ class TranslationManager:
     def set_language(self, language_code: str):
         """Set the current application language"""
         self._current_language = language_code
+        self._cache = {}
     
     def get_language(self) -> str:
         """Get the current application language code"""
@@ -77,6 +81,14 @@ class TranslationManager:
     
     def translate(self, key: str, default: Optional[str] = None) -> str:
         """Get translated string by key (supports nested keys via dot)"""
+        cache_key = (key, default)
+        value = self._cache.get(cache_key)
+        if value is None:
+            value = self._cache[cache_key] = self._resolve(key, default)
+        return value
+    
+    def _resolve(self, key: str, default: Optional[str] = None) -> str:
+        """Walk the language dictionaries for a key, falling back to English, then default/key"""
         lang_dict = self._translations.get(self._current_language, {})
         
         # Support nested keys via dot notation
@@ -21,17 +21,22 @@ def get_base_path():
 ICON_COLOR = "#cccccc"
 ICON_STROKE_WIDTH = 2.0
 
+# get_icon() results, shared until the icon color/stroke changes
+_icon_cache = {}
+
 def set_icon_color(color_hex: str):
     """Set the global icon color and clear cache if needed"""
     global ICON_COLOR
     ICON_COLOR = color_hex
     get_colored_svg_pixmap.cache_clear()
+    _icon_cache.clear()
 
 def set_icon_stroke_width(width: float):
     """Set the global icon stroke width and clear cache if needed"""
     global ICON_STROKE_WIDTH
     ICON_STROKE_WIDTH = width
     get_colored_svg_pixmap.cache_clear()
+    _icon_cache.clear()
 
 @lru_cache(maxsize=512)
 def get_colored_svg_pixmap(path_str: str, color_hex: str, stroke_width: float) -> QPixmap:
@@ -76,6 +81,9 @@ def get_icon(name: str, icons_dir: Path = None, active_color: str = None) -> QIc
     """
     Load an icon by name from the specified or default icons directory
     
+    Icons are cached per (name, icons_dir, active_color) until the icon
+    color or stroke width changes.
+    
     Args:
         name: Icon name (without extension)
         icons_dir: Path to the icons folder (defaults to ./resources/icons)
@@ -84,6 +92,14 @@ def get_icon(name: str, icons_dir: Path = None, active_color: str = None) -> QIc
     Returns:
         QIcon or an empty icon if not found
     """
+    key = (name, icons_dir, active_color)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        icon = _icon_cache[key] = _build_icon(name, icons_dir, active_color)
+    return icon
+
+def _build_icon(name: str, icons_dir: Path, active_color: str) -> QIcon:
+    """Uncached body of get_icon()"""
     if icons_dir is None:
         icons_dir = get_base_path() / "resources" / "icons"
     
@@ -21,6 +21,10 @@ class VisualizerButton(QPushButton):
         self.bar_color.setAlpha(180) # Slightly transparent
         self.decay = [0.0] * self.bar_count
         self.decay_speed = 0.2
+        self.spectrum_bins = 100  # less bins for button
+        # FFT bin sampled by each bar, fixed for the widget's lifetime
+        step = self.spectrum_bins / self.bar_count
+        self._bar_bins = [int(i * step) for i in range(self.bar_count)]
         self.visualizer_enabled = True
         
         # Start animation
@@ -125,7 +129,7 @@ class VisualizerButton(QPushButton):
                 
     def draw_spectrum(self, painter):
         # Get FFT data
-        data = self.player.get_spectrum()
+        data = self.player.get_spectrum(self.spectrum_bins)
         if not data:
             return
             
@@ -133,20 +137,17 @@ class VisualizerButton(QPushButton):
         height = self.height()
         mid_y = height / 2
         
-        useful_data = data[:100] # less bins for button
-        step = len(useful_data) / self.bar_count
-        
-        current_levels = []
-        for i in range(self.bar_count):
-            idx = int(i * step)
-            val = useful_data[idx] 
-            boosted = math.sqrt(val) * 3 
+        decay = self.decay
+        decay_speed = self.decay_speed
+        sqrt = math.sqrt
+        for i, idx in enumerate(self._bar_bins):
+            boosted = sqrt(data[idx]) * 3 
             
-            if boosted > self.decay[i]:
-                self.decay[i] = boosted
+            if boosted > decay[i]:
+                decay[i] = boosted
             else:
-                self.decay[i] = max(0, self.decay[i] - self.decay_speed)
-            current_levels.append(self.decay[i])
+                decay[i] = max(0, decay[i] - decay_speed)
+        current_levels = decay
 
         # Draw centered bars
         bar_width = width / self.bar_count
@@ -6,7 +6,9 @@ import sqlite3
 from pathlib import Path
 
 # Add project root to path so we can import modules
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
 
 @pytest.fixture
 def temp_dir():
@@ -95,3 +95,42 @@ def test_clear_all_data_clears_statistics_and_other_tables(temp_db):
             assert count == 0, f"Table {table} should be empty after clearing"
     finally:
         conn.close()
+
+def test_database_manager_enables_wal(temp_db):
+    db = DatabaseManager(temp_db)
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+    conn = db._connect()
+    try:
+        # synchronous: 1 == NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+def test_get_audiobook_with_files_matches_separate_queries(temp_db):
+    db = DatabaseManager(temp_db)
+    conn = sqlite3.connect(temp_db)
+    try:
+        conn.execute("""
+            INSERT INTO audiobooks (id, path, name, is_folder, duration)
+            VALUES (1, 'Author/Book', 'Book', 0, 300.0)
+        """)
+        conn.executemany("""
+            INSERT INTO audiobook_files (audiobook_id, file_path, file_name, track_number, duration)
+            VALUES (1, ?, ?, ?, 100.0)
+        """, [('Author/Book/02.mp3', '02.mp3', 2), ('Author/Book/01.mp3', '01.mp3', 1)])
+        conn.commit()
+    finally:
+        conn.close()
+
+    info, files = db.get_audiobook_with_files('Author/Book')
+    assert info == db.get_audiobook_info('Author/Book')
+    assert files == db.get_audiobook_files(1)
+    assert [f[1] for f in files] == ['01.mp3', '02.mp3']
+
+    assert db.get_audiobook_with_files('Missing') == (None, [])
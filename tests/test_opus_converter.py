@@ -0,0 +1,126 @@
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from PyQt6.QtWidgets import QApplication
+
+from opus_converter import OpusConversionThread, _iter_convertible_files
+from opus_dialog import OpusConversionDialog
+
+
+def make_fake_popen(lines, on_line=None):
+    """Popen stand-in that writes the output file and replays canned -progress lines"""
+    procs = []
+
+    def fake_popen(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"opus")
+        proc = MagicMock()
+        proc.returncode = 0
+
+        def stdout_lines():
+            for line in lines:
+                if on_line:
+                    on_line(line)
+                yield line
+        proc.stdout = MagicMock()
+        proc.stdout.__iter__.side_effect = lambda: stdout_lines()
+        procs.append(proc)
+        return proc
+
+    return fake_popen, procs
+
+
+def test_progress_pipe_drives_overall_progress(tmp_path):
+    source = tmp_path / "01.mp3"
+    source.write_bytes(b"mp3")
+
+    thread = OpusConversionThread(str(tmp_path))
+    thread.stats.total_files = 2
+    thread._probe_audio = MagicMock(return_value={"duration": 10.0, "channels": 1, "bitrate": 48})
+    emitted = []
+    thread.overall_progress.connect(emitted.append)
+
+    fake_popen, procs = make_fake_popen([
+        b"out_time_us=N/A\n",
+        b"out_time_us=2500000\n",
+        b"progress=continue\n",
+        b"out_time_us=5000000\n",
+        b"out_time_us=12000000\n",
+        b"progress=end\n",
+    ])
+    with patch("opus_converter.subprocess.Popen", side_effect=fake_popen):
+        result = thread._convert_file(source)
+
+    assert result.success
+    assert result.actual_bitrate == 48
+    assert not source.exists()
+    # Fractions are of the whole job (two files), and in-file progress is capped at 1
+    assert emitted == pytest.approx([0.125, 0.25, 0.5])
+    assert thread._active_procs == set()
+
+
+def test_cancel_kills_tracked_processes():
+    thread = OpusConversionThread("")
+    proc = MagicMock()
+    thread._active_procs.add(proc)
+
+    thread.cancel()
+
+    assert thread._cancelled
+    proc.kill.assert_called_once()
+
+
+def test_cancel_during_encode_stops_reading_and_removes_output(tmp_path):
+    source = tmp_path / "01.mp3"
+    source.write_bytes(b"mp3")
+
+    thread = OpusConversionThread(str(tmp_path))
+    thread.stats.total_files = 1
+    thread._probe_audio = MagicMock(return_value={"duration": 10.0, "channels": 1, "bitrate": 48})
+
+    def cancel_midway(line):
+        if line == b"out_time_us=5000000\n":
+            thread.cancel()
+
+    fake_popen, procs = make_fake_popen([
+        b"out_time_us=2500000\n",
+        b"out_time_us=5000000\n",
+        b"out_time_us=7500000\n",
+    ], on_line=cancel_midway)
+    with patch("opus_converter.subprocess.Popen", side_effect=fake_popen):
+        result = thread._convert_file(source)
+
+    assert not result.success
+    assert result.message == "Cancelled"
+    assert procs[0].kill.called
+    assert source.exists()
+    assert not (tmp_path / "01.opus").exists()
+
+
+def test_iter_convertible_files_matches_extensions_case_insensitively(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ("a.MP3", "sub/b.M4b", "c.flac", "d.opus", "e.txt", ".mp3", "mp3"):
+        (tmp_path / name).write_bytes(b"")
+    # A directory with an audio-like name is walked, not yielded
+    (tmp_path / "f.mp3").mkdir()
+    (tmp_path / "f.mp3" / "g.Ogg").write_bytes(b"")
+
+    found = {os.path.relpath(p, tmp_path).replace(os.sep, "/") for p in _iter_convertible_files(str(tmp_path))}
+
+    assert found == {"a.MP3", "sub/b.M4b", "c.flac", "f.mp3/g.Ogg"}
+
+
+def test_dialog_progress_bar_never_moves_backwards():
+    app = QApplication.instance() or QApplication([])
+    dialog = OpusConversionDialog(library_paths=[])
+
+    # The first of four files finishes while the second is 60% encoded
+    dialog._on_overall_progress(0.4)
+    assert dialog.progress_bar.value() == 40
+    dialog._on_progress(1, 4, "01.mp3")
+    assert dialog.progress_bar.value() == 40
+    assert "1" in dialog.progress_label.text() and "4" in dialog.progress_label.text()
+
+    # A finished-file count ahead of the last in-flight report still advances the bar
+    dialog._on_progress(2, 4, "02.mp3")
+    assert dialog.progress_bar.value() == 50
@@ -49,10 +49,7 @@ def test_unload_active_book_resets_state_and_ui():
 
     # Check UI reset calls
     window.update_ui_for_audiobook.assert_called_once()
-    window.player_widget.position_slider.setValue.assert_called_with(0)
-    window.player_widget.total_progress_bar.setValue.assert_called_with(0)
-    window.player_widget.time_current.setText.assert_called_with("0:00")
-    window.player_widget.time_duration.setText.assert_called_with("0:00")
+    window.player_widget.reset_progress_display.assert_called_once()
     assert window.delegate.playing_path is None
     window.library_widget.tree.viewport().update.assert_called_once()
 
@@ -0,0 +1,277 @@
+import sqlite3
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+from PyQt6.QtCore import QCoreApplication
+
+from database import DatabaseManager, init_database
+from player import PlaybackController
+from main import AudiobookPlayerWindow
+
+def setup_test_db(tmp_path, durations=(100, 200, 300)):
+    db_file = tmp_path / "test.db"
+    db = DatabaseManager(str(db_file))
+    init_database(db_file, log_func=None)
+
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO audiobooks (path, name, is_folder, duration, playback_speed)
+        VALUES ('Author/Book', 'Test Book', 0, ?, 1.0)
+    """, (sum(durations),))
+    book_id = cursor.lastrowid
+
+    for i, duration in enumerate(durations, start=1):
+        cursor.execute("""
+            INSERT INTO audiobook_files (audiobook_id, file_path, file_name, track_number, duration, is_url)
+            VALUES (?, ?, ?, ?, ?, 0)
+        """, (book_id, f"Author/Book/{i:02d}.mp3", f"{i:02d}.mp3", i, duration))
+    conn.commit()
+    conn.close()
+    return db, book_id
+
+def make_player_mock():
+    player_mock = MagicMock()
+    player_mock.initialized = True
+    player_mock.load.return_value = True
+    player_mock.is_playing.return_value = False
+    player_mock.get_position.return_value = 0.0
+    player_mock.speed_pos = 10
+    return player_mock
+
+def test_get_audiobook_title_uses_cached_name(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    controller = PlaybackController(make_player_mock(), db)
+    assert controller.get_audiobook_title() == "Audiobook Player"
+
+    assert controller.load_audiobook('Author/Book')
+
+    db.get_audiobook_info = MagicMock(side_effect=AssertionError("unexpected DB query"))
+    assert controller.get_audiobook_title() == "Test Book"
+
+def test_calculate_global_position_uses_prefix_sums(tmp_path):
+    db, book_id = setup_test_db(tmp_path, durations=(100, 200, 300))
+    controller = PlaybackController(make_player_mock(), db)
+    assert controller.load_audiobook('Author/Book')
+
+    for index, expected in enumerate((0.0, 100.0, 300.0)):
+        controller.current_file_index = index
+        controller.calculate_global_position()
+        assert controller.global_position == expected
+
+    # Replacing files_list from outside must not reuse stale offsets
+    controller.files_list = [{'duration': 10}, {'duration': 20}, {'duration': 30}]
+    controller.current_file_index = 2
+    controller.calculate_global_position()
+    assert controller.global_position == 30.0
+
+def read_position(tmp_path, book_id):
+    conn = sqlite3.connect(tmp_path / "test.db")
+    try:
+        return conn.execute("SELECT current_position FROM audiobooks WHERE id = ?", (book_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+def test_save_current_progress_coalesces_writes(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+    controller.progress_flush_interval = 3600
+
+    player_mock.get_position.return_value = 10.0
+    controller.save_current_progress()  # first save is written immediately, off the UI thread
+    controller.wait_for_background_save()
+    assert read_position(tmp_path, book_id) == 10.0
+
+    player_mock.get_position.return_value = 20.0
+    controller.save_current_progress()
+    player_mock.get_position.return_value = 30.0
+    controller.save_current_progress()
+    assert read_position(tmp_path, book_id) == 10.0
+
+    controller.flush_progress()
+    assert read_position(tmp_path, book_id) == 30.0
+
+def test_absolute_paths_resolved_once_per_load(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    controller.library_root = tmp_path
+    assert controller.load_audiobook('Author/Book')
+
+    assert [f['abs'] for f in controller.files_list] == \
+        [str(tmp_path / f"Author/Book/{i:02d}.mp3") for i in (1, 2, 3)]
+
+    assert controller.play_file_at_index(2, start_playing=False)
+    player_mock.load.assert_called_with(str(tmp_path / "Author/Book/03.mp3"))
+
+    # Changing the library root while a book is loaded re-resolves the paths
+    controller.library_root = tmp_path / "moved"
+    assert controller.play_file_at_index(1, start_playing=False)
+    player_mock.load.assert_called_with(str(tmp_path / "moved" / "Author/Book/02.mp3"))
+
+def test_due_flush_runs_in_background_thread(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+
+    calls = []
+    original_save = db.save_progress
+    def recording_save(*args, **kwargs):
+        calls.append(threading.current_thread() is threading.main_thread())
+        original_save(*args, **kwargs)
+    db.save_progress = recording_save
+
+    player_mock.get_position.return_value = 42.0
+    controller.save_current_progress()
+    controller.wait_for_background_save()
+    assert calls == [False]
+    assert read_position(tmp_path, book_id) == 42.0
+
+    # Explicit flushes (pause, book switch, exit) stay synchronous
+    player_mock.get_position.return_value = 50.0
+    controller.save_current_progress()
+    controller.flush_progress()
+    assert calls == [False, True]
+    assert read_position(tmp_path, book_id) == 50.0
+
+def test_save_current_progress_reads_player_position_once(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+    controller.current_file_index = 1
+    controller.calculate_global_position()
+
+    player_mock.get_position.reset_mock()
+    player_mock.get_position.return_value = 50.0
+    controller.save_current_progress()
+    controller.flush_progress()
+    assert player_mock.get_position.call_count == 1
+
+    conn = sqlite3.connect(tmp_path / "test.db")
+    try:
+        row = conn.execute("SELECT listened_duration, progress_percent FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
+    finally:
+        conn.close()
+    assert row == (150.0, 25)
+
+def test_next_and_prev_keep_play_state(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+
+    player_mock.is_playing.return_value = False
+    assert controller.next_file(auto_next=False)
+    player_mock.play.assert_not_called()
+
+    player_mock.is_playing.return_value = True
+    assert controller.prev_file()
+    player_mock.play.assert_called_once()
+
+def test_next_and_prev_refresh_shows_new_progress_without_writing(tmp_path):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    db, book_id = setup_test_db(tmp_path)
+    controller = PlaybackController(make_player_mock(), db)
+    assert controller.load_audiobook('Author/Book')
+    controller.progress_flush_interval = 3600  # keep saves pending until something flushes them
+    controller.save_current_progress()
+    controller.wait_for_background_save()
+
+    window = MagicMock()
+    window.playback_controller = controller
+    window.refresh_audiobook_in_tree = \
+        AudiobookPlayerWindow.refresh_audiobook_in_tree.__get__(window, AudiobookPlayerWindow)
+    controller.on_progress_saved = window.refresh_audiobook_in_tree
+    refreshed = []
+    window.library_widget.refresh_audiobook_item.side_effect = \
+        lambda path: refreshed.append(db.get_audiobook_by_path(path)["listened_duration"])
+
+    # Navigation only updates the in-memory snapshot; the item shows it straight away
+    original_save = db.save_progress
+    db.save_progress = MagicMock(side_effect=AssertionError("unexpected DB write"))
+    AudiobookPlayerWindow.on_next_clicked(window)
+    AudiobookPlayerWindow.on_next_clicked(window)
+    AudiobookPlayerWindow.on_prev_clicked(window)
+    assert refreshed == [0.0, 0.0, 0.0]
+    assert [c.args for c in window.library_widget.update_item_progress.call_args_list] == [
+        ('Author/Book', 100.0, 16), ('Author/Book', 300.0, 50), ('Author/Book', 100.0, 16)
+    ]
+
+    # Once the due background write lands, the item is re-read from the database
+    db.save_progress = original_save
+    controller.progress_flush_interval = 0
+    controller.flush_progress(only_if_due=True)
+    controller.wait_for_background_save()
+    app.processEvents()
+    assert refreshed[-1] == 100.0
+
+def test_progress_percent_follows_total_duration_changes(tmp_path):
+    db, book_id = setup_test_db(tmp_path, durations=(100, 100))
+    controller = PlaybackController(make_player_mock(), db)
+    assert controller.get_progress_percent(50.0) == 0  # nothing loaded
+
+    assert controller.load_audiobook('Author/Book')
+    assert controller.get_progress_percent(50.0) == 25
+    assert controller.get_progress_percent(199.5) == 100
+
+    controller.total_duration = 400.0
+    assert controller.get_progress_percent(50.0) == 12
+
+def test_end_of_book_flushes_pending_progress_before_completion(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+    controller.progress_flush_interval = 3600
+
+    controller.save_current_progress()  # written immediately
+    controller.wait_for_background_save()
+    assert controller.next_file()
+    assert controller.next_file()  # leaves a coalesced save pending
+    assert controller._pending_progress is not None
+
+    assert not controller.next_file()  # end of book
+    assert controller._pending_progress is None
+    controller.flush_progress()
+
+    conn = sqlite3.connect(tmp_path / "test.db")
+    try:
+        row = conn.execute("SELECT progress_percent, is_completed FROM audiobooks WHERE id = ?", (book_id,)).fetchone()
+    finally:
+        conn.close()
+    assert row == (100, 1)
+
+def test_bookmark_lookup_by_file_name(tmp_path):
+    db, book_id = setup_test_db(tmp_path, durations=(100, 200, 300))
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+
+    bookmark_id = db.add_bookmark(book_id, "02.mp3", 50.0, "Mark", "")
+    db.add_bookmark(book_id, "03.mp3", 150.0, "Later", "")
+    db.add_bookmark(book_id, "missing.mp3", 1.0, "Gone", "")
+
+    assert controller.get_bookmarks_percentages() == [150.0 / 600, 450.0 / 600]
+
+    assert controller.jump_to_bookmark(bookmark_id)
+    assert controller.current_file_index == 1
+    player_mock.set_position.assert_called_with(50.0)
+
+    assert db.get_bookmark(bookmark_id)['title'] == "Mark"
+    assert not controller.jump_to_bookmark(bookmark_id + 100)
+
+def test_add_bookmark_reads_player_position_once(tmp_path):
+    db, book_id = setup_test_db(tmp_path)
+    player_mock = make_player_mock()
+    controller = PlaybackController(player_mock, db)
+    assert controller.load_audiobook('Author/Book')
+
+    player_mock.get_position.reset_mock()
+    player_mock.get_position.return_value = 12.0
+    assert controller.add_current_as_bookmark("")
+    assert player_mock.get_position.call_count == 1
@@ -0,0 +1,322 @@
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QListWidget
+
+from player import PlayerWidget
+
+@pytest.fixture
+def widget():
+    app = QApplication.instance() or QApplication([])
+    w = PlayerWidget()
+    yield w
+    w.deleteLater()
+
+def make_files(count):
+    return [
+        {'name': f"{i:02d}.mp3", 'path': f"Book/{i:02d}.mp3", 'duration': 60 * i, 'tag_title': f"Chapter {i}"}
+        for i in range(1, count + 1)
+    ]
+
+def test_highlight_current_file_moves_marker(widget):
+    widget.load_files(make_files(5), 1)
+    plain = [widget.file_list.item(i).data(0) for i in range(5)]
+    assert widget.file_list.item(1).font().bold()
+    assert plain[1].startswith("▶")
+
+    widget.highlight_current_file(3)
+
+    for i in range(5):
+        item = widget.file_list.item(i)
+        assert item.font().bold() == (i == 3)
+        assert item.text().startswith("▶") == (i == 3)
+    assert widget.file_list.item(1).text() == plain[1].replace("▶  ", "", 1)
+    assert widget.file_list.item(3).text() == "▶  " + plain[3]
+
+def test_load_files_resets_highlight(widget):
+    widget.load_files(make_files(3), 2)
+    widget.load_files(make_files(3), 0)
+    bold_rows = [i for i in range(3) if widget.file_list.item(i).font().bold()]
+    assert bold_rows == [0]
+
+def test_seek_tooltip_updates_are_coalesced(widget, mocker):
+    widget.current_file_duration = 600.0
+    widget.position_slider.setSliderDown(True)
+    update = mocker.patch.object(widget, "_update_seek_tooltip")
+    single_shot = mocker.patch("player.QTimer.singleShot")
+
+    for value in (100, 200, 300):
+        widget.on_position_moved(value)
+
+    single_shot.assert_called_once()
+    single_shot.call_args[0][1]()
+    update.assert_called_once_with(300)
+
+def test_file_list_uses_uniform_batched_layout(widget):
+    assert widget.file_list.uniformItemSizes()
+    assert widget.file_list.layoutMode() == QListWidget.LayoutMode.Batched
+
+def test_highlight_same_index_is_noop(widget, mocker):
+    widget.load_files(make_files(3), 2)
+    marked = widget.file_list.item(2).text()
+    fmt = mocker.spy(widget, "_fmt")
+
+    widget.highlight_current_file(2)
+
+    fmt.assert_not_called()
+    assert widget.file_list.item(2).text() == marked
+
+def test_programmatic_speed_and_volume_do_not_emit(widget):
+    emitted = []
+    widget.speed_changed.connect(lambda v: emitted.append(("speed", v)))
+    widget.volume_changed.connect(lambda v: emitted.append(("volume", v)))
+
+    widget.set_speed(15)
+    widget.set_volume(40)
+
+    assert emitted == []
+    assert widget.speed_slider.value() == 15
+    assert widget.volume_slider.value() == 40
+
+    widget.speed_slider.setValue(12)  # user-driven changes still notify
+    widget._emit_pending_slider_values()
+    assert emitted == [("speed", 12)]
+
+def test_id3_toggle_updates_rows_in_place(widget):
+    widget.id3_btn.setChecked(False)
+    widget.load_files(make_files(3), 0)
+    widget.highlight_current_file(1)
+    first_item = widget.file_list.item(0)
+
+    widget.id3_btn.setChecked(True)
+
+    assert widget.file_list.item(0) is first_item  # not rebuilt
+    assert "Chapter 1" in first_item.text()
+    assert widget.file_list.item(1).text().startswith("▶")
+    assert "Chapter 2" in widget.file_list.item(1).text()
+
+    widget.highlight_current_file(2)
+    assert widget.file_list.item(1).text() == widget._file_row_text(2, make_files(3)[1], True)
+
+def test_clickable_slider_maps_pixels_with_cached_handle_length(widget):
+    from PyQt6.QtCore import QPoint
+    slider = widget.volume_slider
+    slider.setRange(0, 1000)
+    slider.resize(220, 20)
+
+    handle = slider._get_slider_len()
+    assert slider._slider_len == handle
+    available = slider.width() - handle
+
+    assert slider.pixelPosToRangeValue(QPoint(0, 0)) == 0
+    assert slider.pixelPosToRangeValue(QPoint(slider.width(), 0)) == 1000
+    mid = handle // 2 + available // 2
+    assert slider.pixelPosToRangeValue(QPoint(mid, 0)) == (available // 2) * 1000 // available
+
+def test_effect_popups_built_on_first_open(widget):
+    assert widget.deesser_popup is None
+    assert widget.pitch_popup is None
+
+    # Values restored from settings before the popups exist are applied on creation
+    widget.set_deesser_preset_value(2)
+    widget.set_pitch_value(-1.5)
+    widget.set_volume_boost_level_value(3.0)
+
+    widget.show_deesser_popup(None)
+    widget.show_pitch_popup(None)
+    widget.show_volume_boost_popup(None)
+    try:
+        assert widget.deesser_slider.value() == 2
+        assert widget.deesser_desc_label.text() == widget._preset_label(2)
+        assert widget.pitch_slider.value() == -15
+        assert widget.volume_boost_slider.value() == 300
+        popup = widget.deesser_popup
+        widget.show_deesser_popup(None)
+        assert widget.deesser_popup is popup
+    finally:
+        widget.deesser_popup.hide()
+        widget.pitch_popup.hide()
+        widget.volume_boost_popup.hide()
+
+def test_clickable_slider_click_notifies_once(widget):
+    from PyQt6.QtCore import QPoint, QPointF, QEvent
+    from PyQt6.QtGui import QMouseEvent
+    slider = widget.volume_slider
+    slider.setRange(0, 100)
+    slider.setValue(0)
+    slider.resize(220, 20)
+
+    events = []
+    slider.valueChanged.connect(lambda v: events.append(("value", v)))
+    slider.sliderPressed.connect(lambda: events.append(("pressed",)))
+    slider.sliderMoved.connect(lambda v: events.append(("moved", v)))
+
+    pos = QPointF(slider.width() * 0.75, 10)
+    press = QMouseEvent(QEvent.Type.MouseButtonPress, pos, pos, Qt.MouseButton.LeftButton,
+                        Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+    slider.mousePressEvent(press)
+
+    expected = slider.pixelPosToRangeValue(QPoint(int(pos.x()), 10))
+    assert events == [("value", expected), ("pressed",), ("moved", expected)]
+    assert slider.value() == expected
+
+def test_effect_slider_drag_is_coalesced(widget):
+    emitted = []
+    widget.vad_threshold_changed_signal.connect(lambda v: emitted.append(("vad", v)))
+    widget.pitch_changed_signal.connect(lambda v: emitted.append(("pitch", v)))
+    widget._ensure_vad_popup()
+    widget._ensure_pitch_popup()
+
+    for value in range(50, 60):
+        widget.vad_slider.setValue(value)
+    widget.pitch_slider.setValue(15)
+    assert widget.vad_label.text() == "59%"  # labels follow every tick
+    assert emitted == []
+
+    widget._slider_emit_timer.timeout.emit()
+    assert emitted == [("vad", 59), ("pitch", 1.5)]
+    assert widget.vad_threshold == 59
+
+def test_toggle_buttons_built_from_specs(widget):
+    for attr, object_name, _, _, _, popup_slot in widget.LEADING_TOGGLE_BUTTONS + widget.EFFECT_TOGGLE_BUTTONS:
+        btn = getattr(widget, attr)
+        assert btn.objectName() == object_name
+        assert btn.isCheckable() and btn.width() == 40
+        has_popup = btn.contextMenuPolicy() == Qt.ContextMenuPolicy.CustomContextMenu
+        assert has_popup == (popup_slot is not None)
+
+    emitted = []
+    widget.mono_toggled_signal.connect(emitted.append)
+    widget.mono_btn.setChecked(True)
+    assert emitted == [True]
+
+def test_slider_release_delivers_final_value(widget):
+    emitted = []
+    widget.speed_changed.connect(emitted.append)
+
+    widget.speed_slider.setValue(11)
+    widget.speed_slider.setValue(13)
+    assert widget.speed_label.text() == widget._fmt("formats.speed", value=1.3)
+    widget.speed_slider.sliderReleased.emit()
+
+    assert emitted == [13]
+    assert not widget._slider_emit_timer.isActive()
+
+def test_preset_labels_follow_language_change(widget):
+    from translations import tr, set_language, get_language
+    previous = get_language()
+    try:
+        set_language("en")
+        widget.update_texts()
+        widget._ensure_deesser_popup()
+        widget.deesser_slider.setValue(2)
+        assert widget.deesser_desc_label.text() == tr("player.preset_strong")
+
+        set_language("ru")
+        widget.update_texts()
+        assert widget.deesser_desc_label.text() == tr("player.preset_strong")
+        assert widget._preset_label(5) == ""
+    finally:
+        set_language(previous)
+
+def test_progress_labels_formatted_once_per_second(widget, mocker):
+    import player
+    fmt_short = mocker.spy(player, "format_time_short")
+
+    widget.update_file_progress(61.2, 300.0)
+    widget.update_file_progress(61.7, 300.0)
+    assert widget.time_current.text() == player.format_time_short(61)
+    assert fmt_short.call_count == 3  # current + duration, then the check above
+
+    widget.update_file_progress(62.1, 300.0)
+    assert fmt_short.call_count == 4
+    assert widget.time_current.text() == player.format_time_short(62)
+
+    widget.update_total_progress(30.0, 120.0)
+    percent_text = widget.total_percent_label.text()
+    widget.update_total_progress(30.4, 120.0)
+    assert widget.total_percent_label.text() == percent_text
+    assert widget.time_left_label.text() == widget._fmt("player.time_left", time=player.format_time(89))
+
+def test_set_playing_only_touches_button_on_change(widget, mocker):
+    widget.load_icons()
+    set_icon = mocker.spy(widget.play_btn, "setIcon")
+
+    widget.set_playing(True)
+    widget.set_playing(True)
+    assert set_icon.call_count == 1
+
+    widget.set_playing(False)
+    assert set_icon.call_count == 2
+
+    widget.load_icons()  # theme reload resets the icon; the state is re-applied next tick
+    widget.set_playing(False)
+    assert set_icon.call_count == 4
+
+def test_pitch_label_translated_once_per_language(widget, mocker):
+    import player
+    widget._ensure_pitch_popup()
+    translate = mocker.spy(player, "tr")
+
+    for value in (5, 10, 15):
+        widget.pitch_slider.setValue(value)
+    assert widget.pitch_val_label.text().startswith("+1.5 ")
+    assert translate.call_count == 0
+
+    widget.update_texts()
+    widget.pitch_slider.setValue(-20)
+    assert widget.pitch_val_label.text() == f"-2.0 {player.tr('player.pitch_label')}"
+
+def test_load_files_reuses_existing_rows(widget):
+    widget.load_files(make_files(5), 4)
+    first_item = widget.file_list.item(0)
+
+    widget.load_files(make_files(3), 0)
+    assert widget.file_list.count() == 3
+    assert widget.file_list.item(0) is first_item
+    assert widget.file_list.item(2).data(Qt.ItemDataRole.UserRole) == "Book/03.mp3"
+    assert [i for i in range(3) if widget.file_list.item(i).font().bold()] == [0]
+
+    widget.load_files(make_files(6), 5)
+    assert widget.file_list.count() == 6
+    assert widget.file_list.item(5).text().startswith("▶")
+    assert not widget.file_list.item(0).text().startswith("▶")
+    assert not widget.file_list.item(0).font().bold()
+
+    widget.load_files([], 0)
+    assert widget.file_list.count() == 0
+
+def test_total_progress_skips_repeated_ticks(widget, mocker):
+    widget.update_total_progress(30.0, 120.0)
+    time_text = mocker.spy(widget, "_time_text")
+
+    widget.update_total_progress(30.0, 120.0)  # paused: same values every tick
+    assert time_text.call_count == 0
+
+    widget.update_total_progress(31.0, 120.0)
+    assert time_text.call_count == 3
+
+    widget.update_texts()  # language change re-renders even with the same values
+    widget.update_total_progress(31.0, 120.0)
+    assert time_text.call_count == 6
+
+def test_reset_progress_display_allows_same_values_again(widget):
+    widget.update_total_progress(30.0, 120.0)
+    shown = widget.total_time_label.text()
+
+    widget.reset_progress_display()
+    assert widget.total_time_label.text() == "0:00:00"
+
+    widget.update_total_progress(30.0, 120.0)
+    assert widget.total_time_label.text() == shown
+
+def test_noise_suppression_indicator_repolishes_only_on_change(widget, mocker):
+    set_property = mocker.spy(widget.noise_suppression_btn, "setProperty")
+
+    widget.set_noise_suppression_active(False)  # already idle
+    widget.set_noise_suppression_active(True)
+    widget.set_noise_suppression_active(True)
+    assert set_property.call_count == 1
+    assert widget.noise_suppression_btn.property("processing") is True
+
+    widget.set_noise_suppression_active(False)
+    assert set_property.call_count == 2
@@ -87,6 +87,14 @@ class TestFixEncoding:
         fixed = AudiobookScanner._fix_encoding(broken)
         assert fixed == original
 
+    def test_accented_latin_left_alone(self):
+        # Decoding would turn "é" into Cyrillic inside a Latin word
+        assert AudiobookScanner._fix_encoding("Café Society") == "Café Society"
+
+    def test_text_outside_latin1_left_alone(self):
+        broken = "Привет".encode('cp1251').decode('latin-1') + " — 1"
+        assert AudiobookScanner._fix_encoding(broken) == broken
+
 class TestTranslation:
     """Tests for tr method"""
     
@@ -106,6 +114,16 @@ class TestTranslation:
         mock_scanner.translations = {"greet": "Hello {name}"}
         assert mock_scanner.tr("greet", name="World") == "Hello World"
 
+    def test_resolved_once_per_translations(self, mock_scanner, mocker):
+        mock_scanner.translations = {"section": {"greet": "Hello {name}"}}
+        resolve = mocker.spy(mock_scanner, "_resolve_tr")
+        assert mock_scanner.tr("section.greet", name="A") == "Hello A"
+        assert mock_scanner.tr("section.greet", name="B") == "Hello B"
+        assert resolve.call_count == 1
+
+        mock_scanner.translations = {"section": {"greet": "Hi {name}"}}
+        assert mock_scanner.tr("section.greet", name="C") == "Hi C"
+
 
 class TestScanAndSaveAllCovers:
     """Tests for _scan_and_save_all_covers method"""
@@ -544,6 +562,156 @@ class TestScannerExecution:
             conn.close()
 
 
+class TestParallelProbing:
+    """ffprobe fallbacks and chapter probes run in the worker pool"""
+
+    def test_ffprobe_fallback_runs_in_workers(self, mock_scanner, temp_dir):
+        import threading
+        files = [temp_dir / f"{i:02d}.mp3" for i in range(1, 4)]
+        probe_threads = []
+
+        mock_scanner._analyze_file_fast = lambda path, verbose=False: {
+            'duration': 0.0, 'bitrate': 0, 'codec': '', 'is_vbr': False, 'needs_ffprobe': path.name != '02.mp3'
+        }
+        def fake_probe(path, info, verbose=False):
+            probe_threads.append(threading.current_thread() is threading.main_thread())
+            return dict(info, duration=float(path.stem), codec='mp3')
+        mock_scanner._analyze_file_with_ffprobe = fake_probe
+
+        results = mock_scanner._analyze_files_parallel(files)
+        assert [r['duration'] for r in results] == [1.0, 0.0, 3.0]
+        assert all('needs_ffprobe' not in r for r in results)
+        assert probe_threads == [False, False]
+
+    def test_extract_chapters_parallel_maps_files(self, mock_scanner, temp_dir):
+        files = [temp_dir / "a.m4b", temp_dir / "b.m4b"]
+        mock_scanner.has_ffprobe = True
+        mock_scanner._extract_chapters = lambda path: [{'title': path.stem, 'start': 0.0, 'duration': 1.0}]
+
+        chapters = mock_scanner._extract_chapters_parallel(files)
+        assert {f.name: c[0]['title'] for f, c in chapters.items()} == {"a.m4b": "a", "b.m4b": "b"}
+        assert mock_scanner._extract_chapters_parallel([]) == {}
+
+
+class TestListFolder:
+    """A book folder is listed once for audio, playlist and cue files"""
+
+    def test_list_folder_splits_by_extension(self, mock_scanner, temp_dir):
+        for name in ("02.mp3", "01.MP3", "book.m3u8", "a.m3u", "book.cue", "cover.jpg"):
+            (temp_dir / name).write_bytes(b"")
+        (temp_dir / "sub.mp3").mkdir()
+
+        audio, playlists, cues = mock_scanner._list_folder(temp_dir)
+        assert [f.name for f in audio] == ["01.MP3", "02.mp3"]
+        assert [f.name for f in playlists] == ["a.m3u", "book.m3u8"]
+        assert [f.name for f in cues] == ["book.cue"]
+        assert mock_scanner._has_audio_files(temp_dir)
+        assert not mock_scanner._has_audio_files(temp_dir / "sub.mp3")
+
+    def test_names_from_walk_are_not_listed_again(self, mock_scanner, temp_dir):
+        folder = temp_dir / "Not On Disk"
+        names = ["02.mp3", "01.mp3", "Book.CUE", "info.TXT", "notes.txt", "Cover.JPG", "back.png"]
+
+        audio, playlists, cues = mock_scanner._list_folder(folder, names)
+        assert audio == [folder / "01.mp3", folder / "02.mp3"]
+        assert playlists == []
+        assert cues == [folder / "Book.CUE"]
+        assert mock_scanner._find_all_root_cover_files(folder, names) == [str(folder / "Cover.JPG"), str(folder / "back.png")]
+        assert mock_scanner._find_description_file(folder, names) == str(folder / "info.TXT")
+
+    def test_cached_embedded_cover_skips_listing(self, mock_scanner, temp_dir):
+        mock_scanner.covers_dir = temp_dir / "covers"
+        mock_scanner.covers_dir.mkdir()
+        cached = mock_scanner._embedded_cover_path("Author/Book")
+        cached.write_bytes(b"jpg")
+        missing_dir = temp_dir / "not-listed"
+
+        assert mock_scanner._extract_embedded_cover(missing_dir, "Author/Book") == str(cached)
+        assert mock_scanner._extract_embedded_cover(missing_dir, "Author/Book", force_update=True) is None
+
+
+class TestFindCover:
+    """Cover search order for _find_cover"""
+
+    def test_subfolder_priority_name_before_any_image(self, mock_scanner, temp_dir, mocker):
+        mock_scanner.covers_dir = temp_dir / "covers"
+        mock_scanner.covers_dir.mkdir()
+        book_dir = temp_dir / "Book"
+        (book_dir / "scans").mkdir(parents=True)
+        (book_dir / "scans" / "back.png").write_bytes(b"png")
+        (book_dir / "art" / "inner").mkdir(parents=True)
+        (book_dir / "art" / "inner" / "Folder.JPG").write_bytes(b"jpg")
+        mocker.patch.object(type(book_dir), "rglob", side_effect=AssertionError("one walk only"))
+
+        original, cached = mock_scanner._find_cover(book_dir, "Book")
+        assert original == str(book_dir / "art" / "inner" / "Folder.JPG")
+        assert cached is not None
+
+        (book_dir / "front.webp").write_bytes(b"webp")
+        original, _ = mock_scanner._find_cover(book_dir, "Book")
+        assert original == str(book_dir / "front.webp")
+
+
+class TestCoverThumbnail:
+    """Covers are decoded straight to the 300 px thumbnail"""
+
+    def test_read_cover_thumbnail_from_bytes_and_path(self, mock_scanner, temp_dir):
+        from PyQt6.QtGui import QImage
+        from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+
+        image = QImage(1200, 600, QImage.Format.Format_RGB32)
+        image.fill(0xff0000)
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "JPG")
+        buffer.close()
+
+        thumb = mock_scanner._read_cover_thumbnail(bytes(data))
+        assert (thumb.width(), thumb.height()) == (300, 150)
+
+        path = temp_dir / "portrait.png"
+        QImage(100, 400, QImage.Format.Format_RGB32).save(str(path))
+        thumb = mock_scanner._read_cover_thumbnail(str(path))
+        assert (thumb.width(), thumb.height()) == (75, 300)
+
+        assert mock_scanner._read_cover_thumbnail(b"not an image").isNull()
+
+
+class TestReadTextFile:
+    """Text files are read once and decoded in memory"""
+
+    @pytest.mark.parametrize("data,expected", [
+        ("TITLE \"Книга\"\r\nPERFORMER \"Автор\"\r\n".encode('cp1251'), "TITLE \"Книга\"\nPERFORMER \"Автор\""),
+        ("Описание\r\n".encode('utf-8-sig'), "Описание"),
+        ("Описание".encode('utf-16'), "Описание"),
+        (b"  \r\n ", ""),
+    ])
+    def test_read_text_file_encodings(self, mock_scanner, temp_dir, data, expected):
+        path = temp_dir / "book.cue"
+        path.write_bytes(data)
+        assert mock_scanner._read_text_file(path) == expected
+
+
+class TestParseCueFile:
+    """Tests for _parse_cue_file method"""
+
+    def test_chapter_durations(self, mock_scanner, temp_dir):
+        path = temp_dir / "book.cue"
+        path.write_text(
+            'PERFORMER "Author"\nTITLE "Book"\nREM DATE 2001\nFILE "book.mp3" MP3\n'
+            '  TRACK 01 AUDIO\n    TITLE "One"\n    INDEX 01 00:00:00\n'
+            '  TRACK 02 AUDIO\n    TITLE "Two"\n    INDEX 01 01:30:00\n'
+            '  TRACK 03 AUDIO\n    TITLE "Three"\n    PERFORMER "Other"\n    INDEX 01 02:00:15\n',
+            encoding='utf-8'
+        )
+        metadata, chapters = mock_scanner._parse_cue_file(path)
+        assert metadata == {'author': 'Author', 'title': 'Book', 'year': '2001', 'narrator': ''}
+        assert [(c['title'], c['author']) for c in chapters] == [("One", "Author"), ("Two", "Author"), ("Three", "Other")]
+        assert [c['start'] for c in chapters] == pytest.approx([0.0, 90.0, 120.2])
+        assert [c['duration'] for c in chapters] == pytest.approx([90.0, 30.2, 0])
+
+
 class TestScanProgressLogging:
     """Tests to verify scanning progress logging outputs correct format and data"""
 
@@ -600,6 +768,42 @@ class TestScanProgressLogging:
         assert "Finished processing book\n" in captured.out
         assert mock_scanner._last_was_progress is False
 
+    def test_log_writes_each_line_once(self, mock_scanner, mocker):
+        writes = []
+        stdout = mocker.patch('sys.stdout')
+        stdout.write.side_effect = lambda text: writes.append(text) if text else None
+
+        mock_scanner._last_was_progress = False
+        mock_scanner._log("\r50% | processing", end="")
+        mock_scanner._log("Finished processing book")
+        assert writes == ["\r50% | processing", "\r" + " " * 90 + "\rFinished processing book\n"]
+
+
+class TestMergedFolderScanning:
+    """Subfolders of a merged book are part of it, not separate books"""
+
+    def test_children_of_merged_folder_are_skipped(self, mock_scanner, temp_dir, mocker):
+        import sqlite3
+        for cd in ("CD1", "CD2"):
+            (temp_dir / "Book" / cd).mkdir(parents=True)
+            (temp_dir / "Book" / cd / "01.mp3").write_bytes(b"\xFF\xFB" + b"\x00" * 100)
+        (temp_dir / "Other").mkdir()
+        (temp_dir / "Other" / "01.mp3").write_bytes(b"\xFF\xFB" + b"\x00" * 100)
+        mocker.patch.object(mock_scanner, "_extract_metadata", lambda dir, files: {'author': '', 'title': dir.name, 'narrator': ''})
+        mocker.patch.object(mock_scanner, "_analyze_file_fast", lambda path, verbose=False: {
+            'duration': 10.0, 'bitrate': 128, 'codec': 'mp3', 'is_vbr': False
+        })
+
+        conn = sqlite3.connect(mock_scanner.db_file)
+        conn.execute("INSERT INTO audiobooks (path, name, is_folder, is_merged) VALUES ('Book', 'Book', 0, 1)")
+        conn.commit()
+        try:
+            mock_scanner.scan_directory(str(temp_dir))
+            rows = conn.execute("SELECT path, file_count FROM audiobooks WHERE is_folder = 0 ORDER BY path").fetchall()
+        finally:
+            conn.close()
+        assert rows == [("Book", 2), ("Other", 1)]
+
 
 class TestSubfolderScanning:
     """Tests to verify scanning of specific subfolders"""
@@ -6,3 +6,18 @@ def test_translations_integrity():
     project_root = Path(__file__).resolve().parent.parent
     total_missing = check_all_translations(project_root)
     assert total_missing == 0, f"Found {total_missing} missing translations. Run 'python tests/check_translations.py' for details."
+
+def test_translate_cache_follows_language_switch():
+    from translations import tr, set_language, get_language
+    previous = get_language()
+    try:
+        set_language("en")
+        assert tr("bookmarks.add") == "Add"
+        assert tr("bookmarks.add") == "Add"  # served from the cache
+
+        set_language("ru")
+        assert tr("bookmarks.add") == "Добавить"
+        assert tr("missing.key", "fallback") == "fallback"
+        assert tr("missing.key") == "missing.key"
+    finally:
+        set_language(previous)
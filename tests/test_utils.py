@@ -124,3 +124,15 @@ class TestLoadIconCache:
         icon3 = load_icon(img_path, 10)
         assert icon3 is not None
         assert icon1 is not icon3
+
+def test_get_icon_reused_until_icon_color_changes():
+    first = utils.get_icon("play")
+    assert utils.get_icon("play") is first
+    assert utils.get_icon("play", active_color="#00ff00") is not first
+
+    old_color = utils.ICON_COLOR
+    try:
+        utils.set_icon_color("#ff0000")
+        assert utils.get_icon("play") is not first
+    finally:
+        utils.set_icon_color(old_color)